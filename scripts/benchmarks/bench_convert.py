@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: Markdown → Notion block conversion.
+
+Converts a synthetic procedure document (numbered steps with nested
+bullet lists, interleaved with tables and blockquotes) at several sizes.
+The tokens are parsed up front, so only the converter's walk is timed;
+time per item should stay flat as the document grows.
+
+Usage:
+    python scripts/benchmarks/bench_convert.py [--items 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from docctl.frontmatter import parse_doc_text
+from docctl.md_to_notion import MarkdownToNotionConverter
+
+
+def procedure_doc(items: int) -> str:
+    """A procedure with `items` numbered steps, a table every 50 steps."""
+    lines = [
+        "---",
+        'doc_uid: "MOS-ENG-SOP-001"',
+        'title: "Synthetic procedure"',
+        "---",
+        "",
+        "# Procedure",
+        "",
+    ]
+    for n in range(1, items + 1):
+        lines.append(f"{n}. Step {n}: set **parameter {n}** per [spec](../DG/spec.md)")
+        if n % 5 == 0:
+            lines.append("   - Check the `reading` is in range")
+            lines.append("   - Record it in the log")
+        if n % 50 == 0:
+            lines += [
+                "",
+                "| Step | Expected | Tolerance |",
+                "|------|----------|-----------|",
+                *(f"| {n - k} | {k * 1.5} | ±0.1 |" for k in range(5)),
+                "",
+                f"> Checkpoint after step {n}.",
+                "",
+                f"{n + 1}. Continue",
+            ]
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Markdown conversion")
+    parser.add_argument("--items", type=int, default=10000,
+                        help="Steps in the largest document (default: 10000)")
+    parser.add_argument("--runs", type=int, default=3,
+                        help="Timed runs; the best is reported (default: 3)")
+    args = parser.parse_args()
+
+    print(f"{'items':>8} {'tokens':>8} {'blocks':>8} {'convert':>10} {'per item':>10}")
+    for items in (args.items // 4, args.items // 2, args.items):
+        doc = parse_doc_text(procedure_doc(items), Path("docs/SOP/synthetic.md"))
+        tokens = doc.tokens
+        converter = MarkdownToNotionConverter(doc)
+
+        best = float("inf")
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            blocks = converter.convert()
+            best = min(best, time.perf_counter() - start)
+
+        print(f"{items:>8} {len(tokens):>8} {len(blocks):>8} "
+              f"{best * 1000:>8.1f}ms {best / items * 1e6:>8.1f}us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
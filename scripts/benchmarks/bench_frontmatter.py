@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: frontmatter parsing.
+
+Compares docctl's frontmatter reader with python-frontmatter on the
+documents under docs/, repeated to simulate a larger corpus. Files are
+read into memory first, so only parsing is timed.
+
+Usage:
+    python scripts/benchmarks/bench_frontmatter.py [--repo-root .] [--scale 100]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import frontmatter
+
+from docctl.config import load_config
+from docctl.frontmatter import parse_doc_text
+
+
+def _best_of(runs: int, fn) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark frontmatter parsing")
+    parser.add_argument("--repo-root", type=Path, default=None)
+    parser.add_argument("--scale", type=int, default=100,
+                        help="Times to repeat the docs corpus (default: 100)")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="Timed runs; the best is reported (default: 5)")
+    args = parser.parse_args()
+
+    config = load_config(args.repo_root)
+    files = sorted(config.docs_dir.rglob("*.md"))
+    texts = [(p, p.read_text(encoding="utf-8")) for p in files] * args.scale
+
+    # Same output from both readers
+    for path, text in texts[:len(files)]:
+        post = frontmatter.loads(text)
+        doc = parse_doc_text(text, path)
+        if doc.metadata != post.metadata or doc.content != post.content:
+            print(f"MISMATCH: {path}")
+            return 1
+
+    def baseline() -> None:
+        for _, text in texts:
+            frontmatter.loads(text)
+
+    def fast() -> None:
+        for path, text in texts:
+            parse_doc_text(text, path)
+
+    base = _best_of(args.runs, baseline)
+    ours = _best_of(args.runs, fast)
+
+    print(f"{len(texts)} documents ({len(files)} files x {args.scale})")
+    print(f"  python-frontmatter: {base * 1000:8.1f} ms")
+    print(f"  docctl.frontmatter: {ours * 1000:8.1f} ms")
+    print(f"  speedup:            {base / ours:8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+Request planning for block uploads.
+
+Every request that carries blocks (pages.create, blocks.children.append)
+is bounded by Notion: at most 100 blocks in any one children array, 1000
+blocks in all, two levels of nesting, and about 500 KB of JSON. Cutting
+a flat list every 100 blocks ignores all but the first, so a deep list
+or a long table fails halfway through an upload.
+
+plan_block_batches packs blocks, nested children included, into as few
+requests as those limits allow. Whatever one request can't carry under a
+block (children nested too deep, or past the 100th) is left as a
+follow-up, appended under that block once it exists.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
+
+from .md_to_notion import NOTION_MAX_BLOCKS_PER_REQUEST
+
+# Blocks in one request, nested children included
+NOTION_MAX_BLOCKS_PER_PAYLOAD = 1000
+
+# Levels of blocks in one request: the top level and its children
+NOTION_MAX_NESTING_DEPTH = 2
+
+NOTION_MAX_PAYLOAD_BYTES = 500_000
+
+# Room for the rest of a request body (parent, "after", ...)
+PAYLOAD_ENVELOPE_BYTES = 1_000
+
+
+def json_size(obj: object) -> int:
+    """
+    Size of `obj` as JSON. Escaped non-ASCII and the default separators
+    make this an upper bound on what the client sends.
+    """
+    return len(json.dumps(obj))
+
+
+@dataclass
+class BlockBatch:
+    """The blocks of one request, and what to append once they exist."""
+
+    blocks: list[dict] = field(default_factory=list)
+    # (index into blocks, children left to append under that block)
+    follow_ups: list[tuple[int, list[dict]]] = field(default_factory=list)
+    count: int = 0
+    size: int = 0
+
+
+def _split(block: dict, levels: int,
+           budget: int) -> tuple[dict, int, int, list[dict]]:
+    """
+    Take as much of `block`'s subtree as one request can carry.
+
+    Returns the payload, its block count and JSON size, and the children
+    left over. A child goes in only with its whole subtree, since blocks
+    created inside a request come back without their ids.
+    """
+    btype = block.get("type", "")
+    data = block.get(btype) or {}
+    children = data.get("children") or []
+    if not children:
+        return block, 1, json_size(block), []
+
+    bare = {**block, btype: {k: v for k, v in data.items() if k != "children"}}
+    count = 1
+    size = json_size(bare) + len(', "children": []')
+    inline: list[dict] = []
+    if levels > 1:
+        for child in children[:NOTION_MAX_BLOCKS_PER_REQUEST]:
+            payload, child_count, child_size, rest = _split(child, levels - 1, budget)
+            if (rest or count + child_count > NOTION_MAX_BLOCKS_PER_PAYLOAD
+                    or size + child_size + 2 > budget):
+                break
+            inline.append(payload)
+            count += child_count
+            size += child_size + 2
+
+    if len(inline) == len(children):
+        return block, count, size, []
+    if inline:
+        bare[btype]["children"] = inline
+    else:
+        size = json_size(bare)
+    return bare, count, size, children[len(inline):]
+
+
+def plan_block_batches(blocks: Iterable[dict],
+                       reserved_bytes: int = 0) -> Iterator[BlockBatch]:
+    """
+    Pack blocks, in order, into request-sized batches.
+
+    `blocks` may be a generator; it is consumed one block at a time.
+    `reserved_bytes` is kept free in each request for other fields, such
+    as page properties. The blocks are not modified: a block that has to
+    leave children for a follow-up is sent as a trimmed copy.
+    """
+    budget = NOTION_MAX_PAYLOAD_BYTES - PAYLOAD_ENVELOPE_BYTES - reserved_bytes
+    batch = BlockBatch()
+
+    for block in blocks:
+        payload, count, size, rest = _split(block, NOTION_MAX_NESTING_DEPTH, budget)
+        if batch.blocks and (
+            len(batch.blocks) == NOTION_MAX_BLOCKS_PER_REQUEST
+            or batch.count + count > NOTION_MAX_BLOCKS_PER_PAYLOAD
+            or batch.size + size + 2 > budget
+        ):
+            yield batch
+            batch = BlockBatch()
+        if rest:
+            batch.follow_ups.append((len(batch.blocks), rest))
+        batch.blocks.append(payload)
+        batch.count += count
+        batch.size += size + 2
+
+    if batch.blocks:
+        yield batch
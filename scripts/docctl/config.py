@@ -61,6 +61,16 @@ class PipelineConfig:
 
     bot_commit_author: str = "mosaic-bot"
 
+    # Notion API throttling (shared by every request in the run)
+    notion_requests_per_second: float = 3.0
+    notion_max_retries: int = 5
+
+    # How page content is rewritten on update: "diff" or "replace"
+    content_sync: str = "diff"
+
+    # Redline granularity for changed lines: "word" or "line"
+    redline_mode: str = "word"
+
     # Constructed at runtime
     docs_dir: Path = field(init=False)
     images_dir: Path = field(init=False)
@@ -105,4 +115,10 @@ def load_config(repo_root: Path | str | None = None) -> PipelineConfig:
         git_pr_url=os.environ.get("PR_URL", ""),
         git_actor=os.environ.get("GITHUB_ACTOR", ""),
         bot_commit_author=os.environ.get("BOT_COMMIT_AUTHOR", "mosaic-bot"),
+        notion_requests_per_second=float(
+            os.environ.get("NOTION_REQUESTS_PER_SECOND", "3")
+        ),
+        notion_max_retries=int(os.environ.get("NOTION_MAX_RETRIES", "5")),
+        content_sync=os.environ.get("NOTION_CONTENT_SYNC", "diff"),
+        redline_mode=os.environ.get("REDLINE_MODE", "word"),
     )
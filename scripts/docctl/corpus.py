@@ -0,0 +1,133 @@
+"""
+The parsed document corpus for a pipeline run.
+
+Every Markdown file under docs/ is read and its frontmatter parsed once,
+up front; validation, UID assignment and publishing then look documents
+up here by path or UID prefix instead of walking the tree again.
+
+When a file is rewritten (auto-UID write-back), `invalidate` drops it so
+the next lookup re-parses just that file. With a ParseCache, files whose
+contents are unchanged since an earlier run skip YAML parsing entirely.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+from pathlib import Path
+
+from .frontmatter import ParsedDoc, parse_doc
+from .parse_cache import ParseCache
+
+logger = logging.getLogger(__name__)
+
+
+class DocCorpus:
+    """All documents under a docs directory, parsed once and indexed."""
+
+    def __init__(self, docs_dir: Path, cache: ParseCache | None = None):
+        self.docs_dir = docs_dir
+        self.cache = cache
+        self._docs: dict[Path, ParsedDoc] = {}
+        self._errors: dict[Path, Exception] = {}
+        self._paths: list[Path] = []  # resolved, sorted
+        self._known: set[Path] = set()
+        self._by_prefix: dict[str, list[str]] | None = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def load(cls, docs_dir: Path,
+             cache: ParseCache | None = None) -> DocCorpus:
+        """Parse every .md file under docs_dir."""
+        corpus = cls(docs_dir, cache)
+        for md_file in sorted(docs_dir.rglob("*.md")):
+            key = md_file.resolve()
+            corpus._paths.append(key)
+            corpus._known.add(key)
+            corpus._parse(md_file)
+        logger.info("Parsed %d doc(s) under %s", len(corpus._docs), docs_dir)
+        return corpus
+
+    def _parse(self, path: Path) -> ParsedDoc | None:
+        key = path.resolve()
+        try:
+            doc = self.cache.parse(path) if self.cache else parse_doc(path)
+        except Exception as exc:
+            print(f"  WARNING: failed to parse {path}: {exc}")
+            self._errors[key] = exc
+            self._docs.pop(key, None)
+            return None
+        self._errors.pop(key, None)
+        self._docs[key] = doc
+        return doc
+
+    # -----------------------------------------------------------------------
+    # Lookups
+    # -----------------------------------------------------------------------
+
+    @property
+    def docs(self) -> list[ParsedDoc]:
+        """All successfully parsed documents, in path order."""
+        with self._lock:
+            for key in self._paths:
+                if key not in self._docs and key not in self._errors:
+                    self._parse(key)
+            return [self._docs[k] for k in self._paths if k in self._docs]
+
+    @property
+    def paths(self) -> list[Path]:
+        """Paths of all successfully parsed documents, in path order."""
+        return [doc.path for doc in self.docs]
+
+    def get(self, path: Path) -> ParsedDoc:
+        """
+        Return the parsed document at path.
+
+        Files outside the corpus are parsed on demand and added to it.
+        Raises the original parse error for files that failed to parse.
+        """
+        key = path.resolve()
+        with self._lock:
+            if key in self._errors:
+                raise self._errors[key]
+            doc = self._docs.get(key)
+            if doc is None:
+                if key not in self._known:
+                    bisect.insort(self._paths, key)
+                    self._known.add(key)
+                doc = self._parse(path)
+                self._by_prefix = None
+                if doc is None:
+                    raise self._errors[key]
+            return doc
+
+    def _build_indexes(self) -> None:
+        seen: set[str] = set()
+        by_prefix: dict[str, list[str]] = {}
+        for doc in self.docs:
+            uid = doc.doc_uid
+            if not uid or uid == "auto" or uid in seen:
+                continue
+            seen.add(uid)
+            by_prefix.setdefault(uid.rsplit("-", 1)[0], []).append(uid)
+        self._by_prefix = by_prefix
+
+    def uids_with_prefix(self, prefix: str) -> list[str]:
+        """Assigned doc_uids under an ORG-DEP-CAT prefix."""
+        with self._lock:
+            if self._by_prefix is None:
+                self._build_indexes()
+            return list(self._by_prefix.get(prefix, []))
+
+    # -----------------------------------------------------------------------
+    # Invalidation
+    # -----------------------------------------------------------------------
+
+    def invalidate(self, path: Path) -> None:
+        """Forget a file's parsed state; it is re-read on next access."""
+        key = path.resolve()
+        with self._lock:
+            self._docs.pop(key, None)
+            self._errors.pop(key, None)
+            self._by_prefix = None
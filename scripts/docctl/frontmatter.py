@@ -1,19 +1,26 @@
 """
 YAML frontmatter parsing, validation, and write-back.
 
-Uses python-frontmatter for reading and ruamel.yaml for writing
-(ruamel preserves formatting and comments when updating doc_uid).
+Frontmatter is split from the body with a single scan for the `---`
+fences and loaded with PyYAML's C safe loader when libyaml is available.
+Files that don't open with a YAML fence (TOML or JSON frontmatter) are
+handed to python-frontmatter. Write-back edits the doc_uid line in place
+so the rest of the file's formatting is preserved.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
 import frontmatter
-from ruamel.yaml import YAML
+import yaml
+from markdown_it.token import Token
 
 from .config import (
     VALID_CATEGORIES,
@@ -21,6 +28,8 @@ from .config import (
     VALID_DESIRED_STATES,
     VALID_ORGS,
 )
+from .markdown_parser import parse_markdown
+from .scan import MarkdownScan, scan_tokens
 
 # ---------------------------------------------------------------------------
 # UID pattern
@@ -30,6 +39,16 @@ DOC_UID_PATTERN = re.compile(
     r"^[A-Z]{2,4}-[A-Z]{2,4}-[A-Z]{2,4}-\d{3,}$"
 )
 
+# ---------------------------------------------------------------------------
+# Frontmatter fences
+# ---------------------------------------------------------------------------
+
+# A fence is a line of three or more dashes (same rule as python-frontmatter)
+OPEN_FENCE_RE = re.compile(r"-{3,}[^\S\n]*(?:\n|\Z)")
+CLOSE_FENCE_RE = re.compile(r"^-{3,}[^\S\n]*$", re.MULTILINE)
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 # ---------------------------------------------------------------------------
 # Parsed document
@@ -96,33 +115,108 @@ class ParsedDoc:
     def uid_prefix(self) -> str:
         return f"{self.org}-{self.department}-{self.category}"
 
+    @cached_property
+    def tokens(self) -> list[Token]:
+        """
+        The body's markdown-it token stream, parsed once on first use and
+        shared by validation and Notion conversion. Treat as read-only.
+        """
+        return parse_markdown(self.content)
+
+    @cached_property
+    def scan(self) -> MarkdownScan:
+        """Links, images and headings of the body (from `tokens`)."""
+        return scan_tokens(self.tokens)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Tokens are several times the size of the text; a process that
+        # receives the doc re-parses on demand rather than unpickling them
+        state = self.__dict__.copy()
+        state.pop("tokens", None)
+        return state
+
+    @property
+    def content_hash(self) -> str:
+        """
+        SHA-256 of the normalized frontmatter and body.
+
+        Key order, line endings and trailing whitespace don't affect the
+        hash, so it changes only when the published content would.
+        """
+        meta = json.dumps(self.metadata, sort_keys=True, default=str)
+        body = "\n".join(
+            line.rstrip() for line in self.content.strip().splitlines()
+        )
+        digest = hashlib.sha256()
+        digest.update(meta.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(body.encode("utf-8"))
+        return digest.hexdigest()
+
 
 # ---------------------------------------------------------------------------
 # Parse
 # ---------------------------------------------------------------------------
 
 
+def _skip_space(text: str, start: int, end: int) -> tuple[int, int]:
+    """Narrow text[start:end] to exclude surrounding whitespace."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def split_frontmatter(text: str) -> tuple[dict[str, Any], int, int]:
+    """
+    Parse the frontmatter of a Markdown text and locate its body.
+
+    Returns (metadata, start, end) where text[start:end] is the body with
+    surrounding whitespace removed, matching python-frontmatter's output.
+    Only the header is handed to the YAML loader; nothing else is copied.
+    """
+    start, end = _skip_space(text, 0, len(text))
+
+    if text.startswith(("+++", "{"), start):
+        # TOML / JSON frontmatter: rare, let python-frontmatter handle it
+        post = frontmatter.loads(text)
+        body = post.content
+        body_start = text.find(body, start) if body else end
+        if body_start < 0:
+            raise ValueError("could not locate document body")
+        return dict(post.metadata), body_start, body_start + len(body)
+
+    opening = OPEN_FENCE_RE.match(text, start)
+    if opening is None:
+        return {}, start, end
+    closing = CLOSE_FENCE_RE.search(text, opening.end(), end)
+    if closing is None:
+        return {}, start, end
+
+    header = text[opening.end():closing.start()]
+    data = yaml.load(header, Loader=YAML_LOADER)
+    metadata = data if isinstance(data, dict) else {}
+
+    body_start, body_end = _skip_space(text, closing.end(), end)
+    return metadata, body_start, body_end
+
+
 def parse_doc(path: Path) -> ParsedDoc:
     """Parse a Markdown file and extract frontmatter + body."""
-    post = frontmatter.load(str(path))
+    return parse_doc_text(path.read_text(encoding="utf-8"), path)
+
+
+def parse_doc_text(text: str, path: Path) -> ParsedDoc:
+    """Parse Markdown text (e.g. a file read from Git history)."""
+    metadata, start, end = split_frontmatter(text)
     return ParsedDoc(
         path=path,
-        metadata=dict(post.metadata),
-        content=post.content,
+        metadata=metadata,
+        content=text[start:end],
     )
 
 
-def parse_all_docs(docs_dir: Path) -> list[ParsedDoc]:
-    """Recursively find and parse all .md files under docs_dir."""
-    docs = []
-    for md_file in sorted(docs_dir.rglob("*.md")):
-        try:
-            docs.append(parse_doc(md_file))
-        except Exception as exc:
-            print(f"  WARNING: failed to parse {md_file}: {exc}")
-    return docs
-
-
 # ---------------------------------------------------------------------------
 # Validate frontmatter
 # ---------------------------------------------------------------------------
@@ -0,0 +1,46 @@
+"""
+The markdown-it configuration shared by validation and Notion conversion.
+
+Both read the same token stream: `ParsedDoc.tokens` parses a document's
+body once, and the validators and MarkdownToNotionConverter walk that
+stream, so what is validated is exactly what gets published.
+
+Building a configured parser (rule chains, plugins) costs far more than
+parsing a short snippet, so each thread builds one on first use and
+reuses it. A MarkdownIt instance keeps per-parse state out of the
+parser itself but compiles its rule caches lazily, hence one per thread
+rather than one shared instance.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from markdown_it import MarkdownIt
+from markdown_it.token import Token
+from mdit_py_plugins.front_matter import front_matter_plugin
+
+
+def new_parser() -> MarkdownIt:
+    """Build a MarkdownIt parser with the pipeline's syntax options."""
+    md = MarkdownIt("commonmark", {"breaks": True})
+    md.enable("table")
+    md.enable("strikethrough")
+    front_matter_plugin(md)
+    return md
+
+
+_local = threading.local()
+
+
+def get_parser() -> MarkdownIt:
+    """This thread's configured parser, built on first use."""
+    md = getattr(_local, "parser", None)
+    if md is None:
+        md = _local.parser = new_parser()
+    return md
+
+
+def parse_markdown(text: str) -> list[Token]:
+    """Parse Markdown into a markdown-it block token stream."""
+    return get_parser().parse(text)
@@ -1,27 +1,30 @@
 """
 Convert Markdown content to Notion API block objects.
 
-Uses markdown-it-py to parse Markdown into tokens, then walks the token
-stream to produce Notion block dicts suitable for the Notion API's
-`append_block_children` endpoint.
+Walks the markdown-it token stream of a document (`ParsedDoc.tokens`,
+the same stream validation reads) to produce Notion block dicts suitable
+for the Notion API's `append_block_children` endpoint.
 
 Handles: headings, paragraphs, bold/italic/strikethrough/code, links
-(internal, Notion, external), images (with captions and width hints),
+(links to published docs and Notion page URLs become page mentions;
+others stay URLs), images (with captions and width hints),
 tables, code blocks, bulleted/numbered lists, blockquotes, horizontal
 rules, and nested list items.
 """
 
 from __future__ import annotations
 
+import os
 import re
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
+from urllib.parse import unquote
 
-from markdown_it import MarkdownIt
 from markdown_it.token import Token
-from mdit_py_plugins.front_matter import front_matter_plugin
 
 from .frontmatter import ParsedDoc
+from .markdown_parser import parse_markdown
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -31,7 +34,12 @@ NOTION_MAX_TEXT_LENGTH = 2000
 NOTION_MAX_BLOCKS_PER_REQUEST = 100
 
 WIDTH_HINT_RE = re.compile(r"\s*\|width=(\d+)\s*$")
-NOTION_URL_RE = re.compile(r"https?://(?:www\.)?notion\.so/")
+NOTION_URL_RE = re.compile(r"https?://(?:[\w-]+\.)?notion\.(?:so|site)/")
+# Page id at the end of a Notion URL path: 32 hex digits, dashed or not
+NOTION_PAGE_ID_RE = re.compile(
+    r"([0-9a-f]{8})-?([0-9a-f]{4})-?([0-9a-f]{4})-?([0-9a-f]{4})-?([0-9a-f]{12})$",
+    re.IGNORECASE,
+)
 
 # Language map for code blocks
 NOTION_LANGUAGES = {
@@ -91,6 +99,60 @@ def _split_long_text(rich_texts: list[dict]) -> list[dict]:
     return result
 
 
+# ---------------------------------------------------------------------------
+# Page mentions
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class PageMentionIndex:
+    """
+    Published pages by source path and by page id, built once per run.
+
+    Turning a link into a page mention is then a path join plus one dict
+    lookup. Source paths are normalized lexically (os.path.normpath), the
+    same way validation's LinkIndex keys them.
+    """
+
+    by_path: dict[str, str]  # normalized doc path -> page_id
+    by_id: dict[str, str]    # dashless lowercase page id -> page_id
+
+    @classmethod
+    def build(cls, doc_uids: dict[str, str],
+              page_id_lookup: dict[str, str]) -> PageMentionIndex:
+        """Join doc path -> doc_uid with doc_uid -> page_id."""
+        by_path = {
+            path: page_id_lookup[uid]
+            for path, uid in doc_uids.items() if uid in page_id_lookup
+        }
+        by_id = {
+            page_id.replace("-", "").lower(): page_id
+            for page_id in page_id_lookup.values()
+        }
+        return cls(by_path=by_path, by_id=by_id)
+
+    def page_for(self, doc_path: Path, href: str) -> str | None:
+        """
+        The page a link should mention: a published doc, by relative path
+        or by Notion URL. None for everything else (left as a plain link),
+        including Notion URLs of databases, views and pages this pipeline
+        didn't publish, which Notion won't accept as page mentions.
+        """
+        if NOTION_URL_RE.match(href):
+            path = href.split("#", 1)[0].split("?", 1)[0].rstrip("/")
+            match = NOTION_PAGE_ID_RE.search(path)
+            if not match:
+                return None
+            return self.by_id.get("".join(match.groups()).lower())
+
+        target = unquote(href.split("#", 1)[0])
+        if not target.endswith(".md") or "://" in target:
+            return None
+        resolved = os.path.normpath(
+            os.path.join(os.path.dirname(doc_path), target))
+        return self.by_path.get(resolved)
+
+
 # ---------------------------------------------------------------------------
 # Inline token → rich_text conversion
 # ---------------------------------------------------------------------------
@@ -99,10 +161,10 @@ def _split_long_text(rich_texts: list[dict]) -> list[dict]:
 class InlineConverter:
     """Converts markdown-it inline tokens to Notion rich_text arrays."""
 
-    def __init__(self, doc: ParsedDoc, page_id_lookup: dict[str, str] | None = None,
+    def __init__(self, doc: ParsedDoc, mentions: PageMentionIndex | None = None,
                  raw_url_base: str = ""):
         self.doc = doc
-        self.page_id_lookup = page_id_lookup or {}
+        self.mentions = mentions
         self.raw_url_base = raw_url_base
 
     def convert(self, tokens: list[Token]) -> list[dict]:
@@ -110,11 +172,19 @@ class InlineConverter:
         result: list[dict] = []
         annotations: dict[str, bool] = {}
         link_stack: list[dict | None] = []
+        in_mention = False
         i = 0
 
         while i < len(tokens):
             tok = tokens[i]
 
+            if in_mention:
+                # A mention renders the page title; the link text is dropped
+                if tok.type == "link_close":
+                    in_mention = False
+                i += 1
+                continue
+
             if tok.type == "text":
                 rt = _text(tok.content, annotations.copy() if annotations else None,
                            link_stack[-1] if link_stack else None)
@@ -144,8 +214,13 @@ class InlineConverter:
 
             elif tok.type == "link_open":
                 href = tok.attrGet("href") or ""
-                link_info = self._resolve_link(href)
-                link_stack.append(link_info)
+                page_id = (self.mentions.page_for(self.doc.path, href)
+                           if self.mentions and href else None)
+                if page_id:
+                    result.append(_mention_page(page_id))
+                    in_mention = True
+                else:
+                    link_stack.append(self._resolve_link(href))
 
             elif tok.type == "link_close":
                 if link_stack:
@@ -165,19 +240,9 @@ class InlineConverter:
         return _split_long_text(result)
 
     def _resolve_link(self, href: str) -> dict | None:
-        """Resolve a link href to a Notion link or page mention."""
+        """Resolve a link href that is not a page mention to a Notion link."""
         if not href:
             return None
-
-        # Internal .md link — try to resolve to Notion page ID
-        if href.endswith(".md") and not href.startswith("http"):
-            resolved = (self.doc.path.parent / href).resolve()
-            for uid, page_id in self.page_id_lookup.items():
-                # We'll use uid matching later; for now, return as URL
-                pass
-            return {"url": href}
-
-        # Any URL
         return {"url": href}
 
     def _image_to_block(self, tok: Token) -> dict | None:
@@ -329,27 +394,29 @@ class MarkdownToNotionConverter:
     Converts a Markdown string to a list of Notion block objects.
 
     Usage:
-        converter = MarkdownToNotionConverter(doc, page_id_lookup, raw_url_base)
+        converter = MarkdownToNotionConverter(doc, mentions, raw_url_base)
         blocks = converter.convert()
     """
 
     def __init__(self, doc: ParsedDoc,
-                 page_id_lookup: dict[str, str] | None = None,
+                 mentions: PageMentionIndex | None = None,
                  raw_url_base: str = ""):
         self.doc = doc
-        self.page_id_lookup = page_id_lookup or {}
+        self.mentions = mentions
         self.raw_url_base = raw_url_base
-        self.inline_converter = InlineConverter(doc, page_id_lookup, raw_url_base)
-
-        self.md = MarkdownIt("commonmark", {"breaks": True})
-        self.md.enable("table")
-        self.md.enable("strikethrough")
-        front_matter_plugin(self.md)
+        self.inline_converter = InlineConverter(doc, mentions, raw_url_base)
 
     def convert(self, markdown: str | None = None) -> list[dict]:
-        """Convert markdown content to Notion blocks."""
-        content = markdown if markdown is not None else self.doc.content
-        tokens = self.md.parse(content)
+        """
+        Convert markdown content to Notion blocks.
+
+        Without `markdown`, converts the document body from its memoized
+        token stream, so a document that was validated isn't parsed again.
+        """
+        if markdown is None:
+            tokens = self.doc.tokens
+        else:
+            tokens = parse_markdown(markdown)
         return self._process_tokens(tokens)
 
     def _process_tokens(self, tokens: list[Token]) -> list[dict]:
@@ -403,34 +470,30 @@ class MarkdownToNotionConverter:
 
             # Bullet list
             if tok.type == "bullet_list_open":
-                list_blocks, consumed = self._process_list(
-                    tokens[i:], "bullet_list", _bulleted_list_item
+                list_blocks, i = self._process_list(
+                    tokens, i, "bullet_list", _bulleted_list_item
                 )
                 blocks.extend(list_blocks)
-                i += consumed
                 continue
 
             # Ordered list
             if tok.type == "ordered_list_open":
-                list_blocks, consumed = self._process_list(
-                    tokens[i:], "ordered_list", _numbered_list_item
+                list_blocks, i = self._process_list(
+                    tokens, i, "ordered_list", _numbered_list_item
                 )
                 blocks.extend(list_blocks)
-                i += consumed
                 continue
 
             # Blockquote
             if tok.type == "blockquote_open":
-                inner_blocks, consumed = self._process_blockquote(tokens[i:])
+                inner_blocks, i = self._process_blockquote(tokens, i)
                 blocks.extend(inner_blocks)
-                i += consumed
                 continue
 
             # Table
             if tok.type == "table_open":
-                table_block, consumed = self._process_table(tokens[i:])
+                table_block, i = self._process_table(tokens, i)
                 blocks.append(table_block)
-                i += consumed
                 continue
 
             # Horizontal rule
@@ -481,12 +544,12 @@ class MarkdownToNotionConverter:
 
         return None
 
-    def _process_list(self, tokens: list[Token], list_type: str,
+    def _process_list(self, tokens: list[Token], start: int, list_type: str,
                       item_factory: Any) -> tuple[list[dict], int]:
-        """Process a list (bullet or ordered) and return blocks + tokens consumed."""
+        """Process a list (bullet or ordered) at tokens[start]; return blocks + end index."""
         blocks: list[dict] = []
         depth = 0
-        i = 0
+        i = start
 
         while i < len(tokens):
             tok = tokens[i]
@@ -504,22 +567,21 @@ class MarkdownToNotionConverter:
                 continue
 
             if tok.type == "list_item_open":
-                item_blocks, consumed = self._process_list_item(
-                    tokens[i:], item_factory
+                item_blocks, i = self._process_list_item(
+                    tokens, i, item_factory
                 )
                 blocks.extend(item_blocks)
-                i += consumed
                 continue
 
             i += 1
 
         return blocks, i
 
-    def _process_list_item(self, tokens: list[Token],
+    def _process_list_item(self, tokens: list[Token], start: int,
                            item_factory: Any) -> tuple[list[dict], int]:
         """Process a single list item, including nested lists."""
         depth = 0
-        i = 0
+        i = start
         item_rich_text: list[dict] = []
         children: list[dict] = []
 
@@ -547,20 +609,18 @@ class MarkdownToNotionConverter:
 
             # Nested bullet list
             if tok.type == "bullet_list_open":
-                nested, consumed = self._process_list(
-                    tokens[i:], "bullet_list", _bulleted_list_item
+                nested, i = self._process_list(
+                    tokens, i, "bullet_list", _bulleted_list_item
                 )
                 children.extend(nested)
-                i += consumed
                 continue
 
             # Nested ordered list
             if tok.type == "ordered_list_open":
-                nested, consumed = self._process_list(
-                    tokens[i:], "ordered_list", _numbered_list_item
+                nested, i = self._process_list(
+                    tokens, i, "ordered_list", _numbered_list_item
                 )
                 children.extend(nested)
-                i += consumed
                 continue
 
             i += 1
@@ -571,11 +631,12 @@ class MarkdownToNotionConverter:
         block = item_factory(item_rich_text, children if children else None)
         return [block], i
 
-    def _process_blockquote(self, tokens: list[Token]) -> tuple[list[dict], int]:
+    def _process_blockquote(self, tokens: list[Token],
+                            start: int) -> tuple[list[dict], int]:
         """Process a blockquote, collecting inner content."""
         blocks: list[dict] = []
         depth = 0
-        i = 0
+        i = start
         collected_text: list[dict] = []
 
         while i < len(tokens):
@@ -609,11 +670,11 @@ class MarkdownToNotionConverter:
 
         return blocks, i
 
-    def _process_table(self, tokens: list[Token]) -> tuple[dict, int]:
-        """Process a table and return a table block + tokens consumed."""
+    def _process_table(self, tokens: list[Token], start: int) -> tuple[dict, int]:
+        """Process a table at tokens[start]; return a table block + end index."""
         rows: list[list[list[dict]]] = []
         has_header = False
-        i = 0
+        i = start
         depth = 0
 
         while i < len(tokens):
@@ -672,10 +733,10 @@ class MarkdownToNotionConverter:
 
 
 def markdown_to_blocks(doc: ParsedDoc,
-                       page_id_lookup: dict[str, str] | None = None,
+                       mentions: PageMentionIndex | None = None,
                        raw_url_base: str = "") -> list[dict]:
     """Convert a parsed document's markdown to Notion blocks."""
-    converter = MarkdownToNotionConverter(doc, page_id_lookup, raw_url_base)
+    converter = MarkdownToNotionConverter(doc, mentions, raw_url_base)
     return converter.convert()
 
 
@@ -683,5 +744,4 @@ def text_to_blocks(text: str) -> list[dict]:
     """Convert raw markdown text to Notion blocks (without doc context)."""
     from .frontmatter import ParsedDoc
     dummy = ParsedDoc(path=Path("."), metadata={}, content=text)
-    converter = MarkdownToNotionConverter(dummy)
-    return converter.convert(text)
+    return MarkdownToNotionConverter(dummy).convert()
@@ -12,25 +12,49 @@ from __future__ import annotations
 
 import logging
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from notion_client import Client
-from notion_client.errors import APIResponseError
 
+from .batching import BlockBatch, json_size, plan_block_batches
 from .config import PipelineConfig
-from .md_to_notion import NOTION_MAX_BLOCKS_PER_REQUEST, _text
+from .md_to_notion import _text
+from .ratelimit import REQUEST_ERRORS, RateLimitedClient, TokenBucket
 
 logger = logging.getLogger(__name__)
 
+# Concurrent blocks.delete calls per page; the rate limiter still applies
+NOTION_DELETE_WORKERS = 8
+
+# Concurrent blocks.children.list calls when fetching a block tree
+NOTION_FETCH_WORKERS = 8
+
+# Blocks that are pages of their own (archives, redlines), not page content
+CHILD_PAGE_TYPES = frozenset({"child_page", "child_database"})
+
 # ---------------------------------------------------------------------------
 # Client factory
 # ---------------------------------------------------------------------------
 
 
-def get_client(config: PipelineConfig) -> Client:
-    """Create a Notion client from config."""
-    return Client(auth=config.notion_token)
+def get_client(config: PipelineConfig,
+               bucket: TokenBucket | None = None) -> Client:
+    """
+    Create a Notion client from config.
+
+    All requests through the client share one rate limiter, so it is safe
+    to use from several publishing threads at once. Pass `bucket` to share
+    the limiter of another client (e.g. an async one).
+    """
+    if bucket is None:
+        bucket = TokenBucket(config.notion_requests_per_second)
+    return RateLimitedClient(
+        bucket,
+        max_retries=config.notion_max_retries,
+        auth=config.notion_token,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -50,10 +74,9 @@ def query_page_by_uid(client: Client, database_id: str,
     return results[0] if results else None
 
 
-def query_all_uids(client: Client, database_id: str,
-                   prefix: str = "") -> list[str]:
-    """Get all doc_uid values from the database, optionally filtered by prefix."""
-    uids: list[str] = []
+def iter_database_pages(client: Client, database_id: str,
+                        db_filter: dict | None = None) -> Iterator[dict]:
+    """Yield every page in the database, following pagination cursors."""
     cursor = None
 
     while True:
@@ -61,28 +84,53 @@ def query_all_uids(client: Client, database_id: str,
             "database_id": database_id,
             "page_size": 100,
         }
-        if prefix:
-            kwargs["filter"] = {
-                "property": "Doc UID",
-                "rich_text": {"starts_with": prefix},
-            }
+        if db_filter:
+            kwargs["filter"] = db_filter
         if cursor:
             kwargs["start_cursor"] = cursor
 
         response = client.databases.query(**kwargs)
-        for page in response.get("results", []):
-            uid_prop = page.get("properties", {}).get("Doc UID", {})
-            rt = uid_prop.get("rich_text", [])
-            if rt:
-                uids.append(rt[0].get("plain_text", ""))
+        yield from response.get("results", [])
 
         if not response.get("has_more"):
             break
         cursor = response.get("next_cursor")
 
+
+def query_all_uids(client: Client, database_id: str,
+                   prefix: str = "") -> list[str]:
+    """Get all doc_uid values from the database, optionally filtered by prefix."""
+    uid_filter = None
+    if prefix:
+        uid_filter = {
+            "property": "Doc UID",
+            "rich_text": {"starts_with": prefix},
+        }
+
+    uids: list[str] = []
+    for page in iter_database_pages(client, database_id, uid_filter):
+        uid = get_page_uid(page)
+        if uid:
+            uids.append(uid)
     return uids
 
 
+def query_page_index(client: Client, database_id: str) -> dict[str, dict]:
+    """
+    Build an index of doc_uid -> page state for every page in the database
+    with a single paginated sweep.
+
+    Each entry is a dict with keys: page_id, revision, status, sha,
+    content_hash, source_path.
+    """
+    index: dict[str, dict] = {}
+    for page in iter_database_pages(client, database_id):
+        uid = get_page_uid(page)
+        if uid:
+            index[uid] = get_page_state(page)
+    return index
+
+
 # ---------------------------------------------------------------------------
 # Page property helpers
 # ---------------------------------------------------------------------------
@@ -121,7 +169,8 @@ def build_page_properties(doc_uid: str, title: str, category: str,
                           status: str, access_groups: list[str],
                           publish: bool, git_sha: str, git_pr: str,
                           git_repo: str, source_path: str,
-                          format_profile: str | None = None) -> dict:
+                          format_profile: str | None = None,
+                          content_hash: str = "") -> dict:
     """Build the properties dict for a page create or update."""
     props: dict[str, Any] = {
         "Title": _title_prop(title),
@@ -134,6 +183,7 @@ def build_page_properties(doc_uid: str, title: str, category: str,
         "Access Groups": _multi_select_prop(access_groups),
         "Publish Enabled": _checkbox_prop(publish),
         "Git Commit SHA": _rich_text_prop(git_sha),
+        "Content Hash": _rich_text_prop(content_hash),
         "Git PR": _rich_text_prop(git_pr) if git_pr else _rich_text_prop(""),
         "Git Repo": _rich_text_prop(git_repo) if git_repo else _rich_text_prop(""),
         "Source Path": _rich_text_prop(source_path),
@@ -149,62 +199,211 @@ def build_page_properties(doc_uid: str, title: str, category: str,
 # ---------------------------------------------------------------------------
 
 
-def get_page_blocks(client: Client, page_id: str) -> list[dict]:
-    """Retrieve all blocks from a page."""
+def _list_children(client: Client, block_id: str) -> tuple[list[dict], int]:
+    """All direct children of a block, and the number of requests made."""
     blocks: list[dict] = []
     cursor = None
+    calls = 0
 
     while True:
-        kwargs: dict[str, Any] = {"block_id": page_id, "page_size": 100}
+        kwargs: dict[str, Any] = {"block_id": block_id, "page_size": 100}
         if cursor:
             kwargs["start_cursor"] = cursor
 
         response = client.blocks.children.list(**kwargs)
+        calls += 1
         blocks.extend(response.get("results", []))
 
         if not response.get("has_more"):
             break
         cursor = response.get("next_cursor")
 
-    return blocks
+    return blocks, calls
 
 
-def delete_all_blocks(client: Client, page_id: str) -> int:
-    """Delete all blocks from a page. Returns the count of deleted blocks."""
-    blocks = get_page_blocks(client, page_id)
-    count = 0
-    for block in blocks:
-        try:
-            client.blocks.delete(block_id=block["id"])
-            count += 1
-        except APIResponseError as e:
-            logger.warning("Failed to delete block %s: %s", block["id"], e)
-    return count
+def _expands(block: dict) -> bool:
+    """True if a block's children are part of its content (not a child page)."""
+    return bool(block.get("has_children")) and block.get("type") not in CHILD_PAGE_TYPES
 
 
-def append_blocks(client: Client, page_id: str,
-                  blocks: list[dict]) -> list[dict]:
+def fetch_block_tree(client: Client, block_id: str,
+                     max_workers: int = NOTION_FETCH_WORKERS) -> dict[str, Any]:
     """
-    Append blocks to a page, batching to respect the 100-block limit.
-    Returns the list of created block objects.
+    Fetch a block's children with all of their descendants.
+
+    Children are listed breadth-first on a bounded thread pool: every
+    block with children is queued as soon as its parent's listing comes
+    back, so wall time grows with tree depth, not block count. Each
+    block's children are attached as `block[type]["children"]`, the same
+    shape as create payloads; child pages are not expanded.
+
+    Returns a dict with the top-level "blocks", the number of
+    "api_calls" made, the tree "depth" and the elapsed "seconds".
     """
-    created: list[dict] = []
+    started = time.perf_counter()
+    api_calls = 0
+    depth = 0
+    root: list[dict] = []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = {pool.submit(_list_children, client, block_id): (None, 1)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                parent, level = pending.pop(future)
+                children, calls = future.result()
+                api_calls += calls
+                depth = max(depth, level)
+                if parent is None:
+                    root = children
+                else:
+                    parent[parent["type"]]["children"] = children
+                for child in children:
+                    if _expands(child):
+                        listing = pool.submit(_list_children, client, child["id"])
+                        pending[listing] = (child, level + 1)
+
+    return {
+        "blocks": root,
+        "api_calls": api_calls,
+        "depth": depth,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def get_page_blocks(client: Client, page_id: str,
+                    recursive: bool = False) -> list[dict]:
+    """
+    Retrieve all blocks from a page.
 
-    for i in range(0, len(blocks), NOTION_MAX_BLOCKS_PER_REQUEST):
-        batch = blocks[i:i + NOTION_MAX_BLOCKS_PER_REQUEST]
-        response = client.blocks.children.append(
-            block_id=page_id,
-            children=batch,
+    With `recursive`, nested blocks (table rows, list items, toggles) are
+    fetched too and attached to their parents; see fetch_block_tree.
+    """
+    if not recursive:
+        return _list_children(client, page_id)[0]
+    tree = fetch_block_tree(client, page_id)
+    logger.info("Fetched %s: depth %d in %d request(s), %.2fs",
+                page_id, tree["depth"], tree["api_calls"], tree["seconds"])
+    return tree["blocks"]
+
+
+def delete_blocks(client: Client, block_ids: list[str],
+                  max_workers: int = NOTION_DELETE_WORKERS) -> dict[str, Any]:
+    """
+    Delete blocks concurrently on a bounded thread pool.
+
+    Requests still pass through the client's shared rate limiter. Failures
+    (API errors, and server errors or timeouts left after the client's
+    retries) are collected and logged together rather than raised.
+    Returns a dict with the count of deleted blocks, the list of failures,
+    and the elapsed seconds.
+    """
+    started = time.perf_counter()
+    failures: list[str] = []
+
+    def delete(block_id: str) -> None:
+        client.blocks.delete(block_id=block_id)
+
+    if block_ids:
+        workers = min(max_workers, len(block_ids))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(delete, bid): bid for bid in block_ids}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except REQUEST_ERRORS as e:
+                    failures.append(f"{futures[future]}: {e}")
+
+    if failures:
+        logger.warning(
+            "Failed to delete %d of %d block(s):\n  %s",
+            len(failures), len(block_ids), "\n  ".join(sorted(failures)),
         )
-        created.extend(response.get("results", []))
 
-        # Rate limiting: be polite
-        if i + NOTION_MAX_BLOCKS_PER_REQUEST < len(blocks):
-            time.sleep(0.35)
+    return {
+        "deleted": len(block_ids) - len(failures),
+        "failed": sorted(failures),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def delete_page_content(client: Client, page_id: str) -> dict[str, Any]:
+    """
+    Delete a page's content blocks, keeping its child pages.
+    Returns the delete_blocks result (deleted, failed, seconds).
+    """
+    blocks = get_page_blocks(client, page_id)
+    outcome = delete_blocks(client, [
+        b["id"] for b in blocks if b.get("type") not in CHILD_PAGE_TYPES
+    ])
+    logger.info("Deleted %d block(s) from %s in %.2fs",
+                outcome["deleted"], page_id, outcome["seconds"])
+    return outcome
+
+
+def snapshot_blocks(blocks: list[dict]) -> list[dict]:
+    """
+    Copy blocks into create/append payloads.
+
+    Drops read-only fields (id, timestamps, has_children, ...) and child
+    pages, so blocks read from a page or from the publish-state cache can
+    be written to another page.
+    """
+    payloads: list[dict] = []
+    for block in blocks:
+        btype = block.get("type", "")
+        if btype in ("child_page", "child_database", "unsupported"):
+            continue
+        data = dict(block.get(btype) or {})
+        if data.get("children"):
+            data["children"] = snapshot_blocks(data["children"])
+        payloads.append({"type": btype, btype: data})
+    return payloads
+
+
+def _append_follow_ups(client: Client, batch: BlockBatch,
+                       created: list[dict]) -> None:
+    """Append the children a batch couldn't carry under their new parents."""
+    for index, children in batch.follow_ups:
+        append_blocks(client, created[index]["id"], children)
+
+
+def _append_batches(client: Client, block_id: str,
+                    batches: Iterable[BlockBatch],
+                    after: str | None = None) -> list[dict]:
+    """Send planned batches under a block, in order; the created blocks."""
+    created: list[dict] = []
+
+    for batch in batches:
+        kwargs: dict[str, Any] = {"block_id": block_id, "children": batch.blocks}
+        if after:
+            kwargs["after"] = after
+        response = client.blocks.children.append(**kwargs)
+        results = response.get("results", [])
+        created.extend(results)
+        _append_follow_ups(client, batch, results)
+        if after and results:
+            after = results[-1]["id"]
 
     return created
 
 
+def append_blocks(client: Client, page_id: str,
+                  blocks: Iterable[dict], after: str | None = None) -> list[dict]:
+    """
+    Append blocks to a page in as few requests as Notion's limits allow.
+
+    Nested children are sent along with their parents where the request
+    size and nesting limits allow, and appended under them otherwise
+    (see batching.plan_block_batches).
+    `blocks` may be a generator; it is consumed one batch at a time.
+    If `after` is a block ID, the blocks are inserted directly after that
+    block instead of at the end of the page.
+    Returns the list of created top-level block objects.
+    """
+    return _append_batches(client, page_id, plan_block_batches(blocks), after)
+
+
 # ---------------------------------------------------------------------------
 # Revision history table
 # ---------------------------------------------------------------------------
@@ -318,25 +517,32 @@ def build_footer_blocks(git_sha: str, pr_url: str = "",
 # ---------------------------------------------------------------------------
 
 
-def create_page(client: Client, database_id: str,
-                properties: dict, blocks: list[dict]) -> dict:
-    """Create a new page in the database with properties and content."""
-    # Notion API limits children to 100 blocks on create
-    initial_blocks = blocks[:NOTION_MAX_BLOCKS_PER_REQUEST]
-    remaining_blocks = blocks[NOTION_MAX_BLOCKS_PER_REQUEST:]
+def _create_page(client: Client, parent: dict, properties: dict,
+                 blocks: Iterable[dict]) -> dict:
+    """pages.create with the first batch of blocks; the rest are appended."""
+    batches = plan_block_batches(blocks, reserved_bytes=json_size(properties))
+    first = next(batches, BlockBatch())
 
     page = client.pages.create(
-        parent={"database_id": database_id},
+        parent=parent,
         properties=properties,
-        children=initial_blocks,
+        children=first.blocks,
     )
 
-    if remaining_blocks:
-        append_blocks(client, page["id"], remaining_blocks)
+    if first.follow_ups:
+        # pages.create doesn't return the created blocks
+        _append_follow_ups(client, first, _list_children(client, page["id"])[0])
+    _append_batches(client, page["id"], batches)
 
     return page
 
 
+def create_page(client: Client, database_id: str,
+                properties: dict, blocks: list[dict]) -> dict:
+    """Create a new page in the database with properties and content."""
+    return _create_page(client, {"database_id": database_id}, properties, blocks)
+
+
 def update_page_properties(client: Client, page_id: str,
                            properties: dict) -> dict:
     """Update a page's properties."""
@@ -344,11 +550,26 @@ def update_page_properties(client: Client, page_id: str,
 
 
 def replace_page_content(client: Client, page_id: str,
-                         new_blocks: list[dict]) -> None:
-    """Clear a page's content and replace with new blocks."""
-    delete_all_blocks(client, page_id)
+                         new_blocks: list[dict]) -> dict[str, Any]:
+    """
+    Clear a page's content and replace with new blocks.
+    Child pages (archives and redlines) are kept.
+    Each block in `new_blocks` is tagged with its created block "id".
+    Returns counts in the same shape as sync.sync_page_content.
+    """
+    deletion = delete_page_content(client, page_id)
     if new_blocks:
-        append_blocks(client, page_id, new_blocks)
+        created = append_blocks(client, page_id, new_blocks)
+        for block, created_block in zip(new_blocks, created):
+            block["id"] = created_block["id"]
+    return {
+        "kept": 0,
+        "updated": 0,
+        "inserted": len(new_blocks),
+        "deleted": deletion["deleted"],
+        "delete_failed": deletion["failed"],
+        "delete_seconds": deletion["seconds"],
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -357,22 +578,20 @@ def replace_page_content(client: Client, page_id: str,
 
 
 def create_child_page(client: Client, parent_page_id: str,
-                      title: str, blocks: list[dict]) -> dict:
-    """Create a child page under the given parent page."""
-    initial_blocks = blocks[:NOTION_MAX_BLOCKS_PER_REQUEST]
-    remaining_blocks = blocks[NOTION_MAX_BLOCKS_PER_REQUEST:]
+                      title: str, blocks: Iterable[dict]) -> dict:
+    """
+    Create a child page under the given parent page.
 
-    page = client.pages.create(
-        parent={"page_id": parent_page_id},
-        properties={"title": [{"text": {"content": title}}]},
-        children=initial_blocks,
+    `blocks` may be a generator: the first batch goes with the create call
+    and the rest are appended batch by batch as they are produced.
+    """
+    return _create_page(
+        client,
+        {"page_id": parent_page_id},
+        {"title": [{"text": {"content": title}}]},
+        blocks,
     )
 
-    if remaining_blocks:
-        append_blocks(client, page["id"], remaining_blocks)
-
-    return page
-
 
 def create_archive_page(client: Client, parent_page_id: str,
                         doc_uid: str, revision: str,
@@ -385,7 +604,7 @@ def create_archive_page(client: Client, parent_page_id: str,
 
 def create_redline_page(client: Client, parent_page_id: str,
                         doc_uid: str, prev_rev: str, new_rev: str,
-                        redline_blocks: list[dict]) -> dict:
+                        redline_blocks: Iterable[dict]) -> dict:
     """Create a redline child page with the diff content."""
     title = f"Redline: {doc_uid} v{prev_rev} \u2192 v{new_rev}"
     logger.info("Creating redline page: %s", title)
@@ -397,6 +616,13 @@ def create_redline_page(client: Client, parent_page_id: str,
 # ---------------------------------------------------------------------------
 
 
+def get_page_uid(page: dict) -> str:
+    """Extract the doc_uid from a page's properties."""
+    uid_prop = page.get("properties", {}).get("Doc UID", {})
+    rt = uid_prop.get("rich_text", [])
+    return rt[0].get("plain_text", "") if rt else ""
+
+
 def get_page_revision(page: dict) -> str:
     """Extract the current revision string from a page's properties."""
     rev_prop = page.get("properties", {}).get("Revision", {})
@@ -416,3 +642,29 @@ def get_page_sha(page: dict) -> str:
     sha_prop = page.get("properties", {}).get("Git Commit SHA", {})
     rt = sha_prop.get("rich_text", [])
     return rt[0].get("plain_text", "") if rt else ""
+
+
+def get_page_source_path(page: dict) -> str:
+    """Extract the repo-relative source path from a page's properties."""
+    path_prop = page.get("properties", {}).get("Source Path", {})
+    rt = path_prop.get("rich_text", [])
+    return rt[0].get("plain_text", "") if rt else ""
+
+
+def get_page_content_hash(page: dict) -> str:
+    """Extract the normalized content hash from a page's properties."""
+    hash_prop = page.get("properties", {}).get("Content Hash", {})
+    rt = hash_prop.get("rich_text", [])
+    return rt[0].get("plain_text", "") if rt else ""
+
+
+def get_page_state(page: dict) -> dict:
+    """Summarize a page as the state the publisher needs to plan an update."""
+    return {
+        "page_id": page["id"],
+        "revision": get_page_revision(page),
+        "status": get_page_status(page),
+        "sha": get_page_sha(page),
+        "content_hash": get_page_content_hash(page),
+        "source_path": get_page_source_path(page),
+    }
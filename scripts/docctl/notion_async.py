@@ -0,0 +1,403 @@
+"""
+Asyncio variant of the Notion API layer.
+
+Mirrors the request-making functions of notion_api (database queries,
+block listing, appends, deletes, page and child-page creation) on
+notion_client.AsyncClient, so a single event loop can keep many requests
+in flight. Payload builders and property readers are not duplicated:
+use the ones in notion_api.
+
+Every request goes through one keep-alive httpx connection pool and,
+when the sync client's bucket is passed in, the same rate limiter as the
+synchronous client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Iterable
+
+import httpx
+from notion_client import AsyncClient
+
+from .batching import BlockBatch, json_size, plan_block_batches
+from .config import PipelineConfig
+from .notion_api import (
+    CHILD_PAGE_TYPES,
+    NOTION_DELETE_WORKERS,
+    NOTION_FETCH_WORKERS,
+    _expands,
+    get_page_state,
+    get_page_uid,
+)
+from .ratelimit import REQUEST_ERRORS, RateLimitedAsyncClient, TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# Size of the shared keep-alive pool; the rate limiter still applies
+NOTION_MAX_CONNECTIONS = 32
+
+# ---------------------------------------------------------------------------
+# Client factory
+# ---------------------------------------------------------------------------
+
+
+def get_async_client(config: PipelineConfig,
+                     bucket: TokenBucket | None = None) -> AsyncClient:
+    """
+    Create an async Notion client from config.
+
+    Pass the bucket of a client from notion_api.get_client (its `bucket`
+    attribute) to share one request budget between the two. The client
+    owns a connection pool; close it with `await client.aclose()`.
+    """
+    if bucket is None:
+        bucket = TokenBucket(config.notion_requests_per_second)
+    pool = httpx.AsyncClient(limits=httpx.Limits(
+        max_connections=NOTION_MAX_CONNECTIONS,
+        max_keepalive_connections=NOTION_MAX_CONNECTIONS,
+    ))
+    return RateLimitedAsyncClient(
+        bucket,
+        max_retries=config.notion_max_retries,
+        auth=config.notion_token,
+        client=pool,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Database queries
+# ---------------------------------------------------------------------------
+
+
+async def query_page_by_uid(client: AsyncClient, database_id: str,
+                            doc_uid: str) -> dict | None:
+    """Find the canonical page for a doc_uid. Returns the page object or None."""
+    response = await client.databases.query(
+        database_id=database_id,
+        filter={"property": "Doc UID", "rich_text": {"equals": doc_uid}},
+        page_size=1,
+    )
+    results = response.get("results", [])
+    return results[0] if results else None
+
+
+async def iter_database_pages(client: AsyncClient, database_id: str,
+                              db_filter: dict | None = None) -> AsyncIterator[dict]:
+    """Yield every page in the database, following pagination cursors."""
+    cursor = None
+
+    while True:
+        kwargs: dict[str, Any] = {
+            "database_id": database_id,
+            "page_size": 100,
+        }
+        if db_filter:
+            kwargs["filter"] = db_filter
+        if cursor:
+            kwargs["start_cursor"] = cursor
+
+        response = await client.databases.query(**kwargs)
+        for page in response.get("results", []):
+            yield page
+
+        if not response.get("has_more"):
+            break
+        cursor = response.get("next_cursor")
+
+
+async def query_all_uids(client: AsyncClient, database_id: str,
+                         prefix: str = "") -> list[str]:
+    """Get all doc_uid values from the database, optionally filtered by prefix."""
+    uid_filter = None
+    if prefix:
+        uid_filter = {
+            "property": "Doc UID",
+            "rich_text": {"starts_with": prefix},
+        }
+
+    uids: list[str] = []
+    async for page in iter_database_pages(client, database_id, uid_filter):
+        uid = get_page_uid(page)
+        if uid:
+            uids.append(uid)
+    return uids
+
+
+async def query_page_index(client: AsyncClient,
+                           database_id: str) -> dict[str, dict]:
+    """Index doc_uid -> page state for every page (see notion_api)."""
+    index: dict[str, dict] = {}
+    async for page in iter_database_pages(client, database_id):
+        uid = get_page_uid(page)
+        if uid:
+            index[uid] = get_page_state(page)
+    return index
+
+
+# ---------------------------------------------------------------------------
+# Page content management
+# ---------------------------------------------------------------------------
+
+
+async def _list_children(client: AsyncClient,
+                         block_id: str) -> tuple[list[dict], int]:
+    """All direct children of a block, and the number of requests made."""
+    blocks: list[dict] = []
+    cursor = None
+    calls = 0
+
+    while True:
+        kwargs: dict[str, Any] = {"block_id": block_id, "page_size": 100}
+        if cursor:
+            kwargs["start_cursor"] = cursor
+
+        response = await client.blocks.children.list(**kwargs)
+        calls += 1
+        blocks.extend(response.get("results", []))
+
+        if not response.get("has_more"):
+            break
+        cursor = response.get("next_cursor")
+
+    return blocks, calls
+
+
+async def fetch_block_tree(client: AsyncClient, block_id: str,
+                           max_workers: int = NOTION_FETCH_WORKERS) -> dict[str, Any]:
+    """
+    Fetch a block's children with all of their descendants.
+
+    Same tree shape and result as notion_api.fetch_block_tree; at most
+    `max_workers` listings are in flight.
+    """
+    started = time.perf_counter()
+    limit = asyncio.Semaphore(max_workers)
+    stats = {"api_calls": 0, "depth": 0}
+
+    async def expand(parent_id: str, level: int) -> list[dict]:
+        async with limit:
+            children, calls = await _list_children(client, parent_id)
+        stats["api_calls"] += calls
+        stats["depth"] = max(stats["depth"], level)
+        nested = [child for child in children if _expands(child)]
+        subtrees = await asyncio.gather(
+            *(expand(child["id"], level + 1) for child in nested))
+        for child, subtree in zip(nested, subtrees):
+            child[child["type"]]["children"] = subtree
+        return children
+
+    blocks = await expand(block_id, 1)
+    return {
+        "blocks": blocks,
+        **stats,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+async def get_page_blocks(client: AsyncClient, page_id: str,
+                          recursive: bool = False) -> list[dict]:
+    """
+    Retrieve all blocks from a page.
+
+    With `recursive`, nested blocks are fetched too; see fetch_block_tree.
+    """
+    if not recursive:
+        return (await _list_children(client, page_id))[0]
+    tree = await fetch_block_tree(client, page_id)
+    logger.info("Fetched %s: depth %d in %d request(s), %.2fs",
+                page_id, tree["depth"], tree["api_calls"], tree["seconds"])
+    return tree["blocks"]
+
+
+async def delete_blocks(client: AsyncClient, block_ids: list[str],
+                        max_workers: int = NOTION_DELETE_WORKERS) -> dict[str, Any]:
+    """
+    Delete blocks with at most `max_workers` requests in flight.
+
+    Same result shape as notion_api.delete_blocks: the count of deleted
+    blocks, the list of failures, and the elapsed seconds.
+    """
+    started = time.perf_counter()
+    failures: list[str] = []
+    limit = asyncio.Semaphore(max_workers)
+
+    async def delete(block_id: str) -> None:
+        async with limit:
+            try:
+                await client.blocks.delete(block_id=block_id)
+            except REQUEST_ERRORS as e:
+                failures.append(f"{block_id}: {e}")
+
+    await asyncio.gather(*(delete(bid) for bid in block_ids))
+
+    if failures:
+        logger.warning(
+            "Failed to delete %d of %d block(s):\n  %s",
+            len(failures), len(block_ids), "\n  ".join(sorted(failures)),
+        )
+
+    return {
+        "deleted": len(block_ids) - len(failures),
+        "failed": sorted(failures),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+async def delete_page_content(client: AsyncClient, page_id: str) -> dict[str, Any]:
+    """
+    Delete a page's content blocks, keeping its child pages.
+    Returns the delete_blocks result (deleted, failed, seconds).
+    """
+    blocks = await get_page_blocks(client, page_id)
+    outcome = await delete_blocks(client, [
+        b["id"] for b in blocks if b.get("type") not in CHILD_PAGE_TYPES
+    ])
+    logger.info("Deleted %d block(s) from %s in %.2fs",
+                outcome["deleted"], page_id, outcome["seconds"])
+    return outcome
+
+
+async def _append_follow_ups(client: AsyncClient, batch: BlockBatch,
+                             created: list[dict]) -> None:
+    """Append the children a batch couldn't carry, under each parent at once."""
+    await asyncio.gather(*(
+        append_blocks(client, created[index]["id"], children)
+        for index, children in batch.follow_ups
+    ))
+
+
+async def _append_batches(client: AsyncClient, block_id: str,
+                          batches: Iterable[BlockBatch],
+                          after: str | None = None) -> list[dict]:
+    """Send planned batches under a block, in order; the created blocks."""
+    created: list[dict] = []
+
+    for batch in batches:
+        kwargs: dict[str, Any] = {"block_id": block_id, "children": batch.blocks}
+        if after:
+            kwargs["after"] = after
+        response = await client.blocks.children.append(**kwargs)
+        results = response.get("results", [])
+        created.extend(results)
+        await _append_follow_ups(client, batch, results)
+        if after and results:
+            after = results[-1]["id"]
+
+    return created
+
+
+async def append_blocks(client: AsyncClient, page_id: str,
+                        blocks: Iterable[dict],
+                        after: str | None = None) -> list[dict]:
+    """
+    Append blocks to a page in as few requests as Notion's limits allow
+    (see notion_api.append_blocks).
+
+    Batches are sent one after another, since each lands after the last;
+    follow-up appends under different parents run concurrently.
+    Returns the list of created top-level block objects.
+    """
+    return await _append_batches(client, page_id, plan_block_batches(blocks),
+                                 after)
+
+
+# ---------------------------------------------------------------------------
+# Page creation and update
+# ---------------------------------------------------------------------------
+
+
+async def _create_page(client: AsyncClient, parent: dict, properties: dict,
+                       blocks: Iterable[dict]) -> dict:
+    """pages.create with the first batch of blocks; the rest are appended."""
+    batches = plan_block_batches(blocks, reserved_bytes=json_size(properties))
+    first = next(batches, BlockBatch())
+
+    page = await client.pages.create(
+        parent=parent,
+        properties=properties,
+        children=first.blocks,
+    )
+
+    if first.follow_ups:
+        # pages.create doesn't return the created blocks
+        created, _ = await _list_children(client, page["id"])
+        await _append_follow_ups(client, first, created)
+    await _append_batches(client, page["id"], batches)
+
+    return page
+
+
+async def create_page(client: AsyncClient, database_id: str,
+                      properties: dict, blocks: list[dict]) -> dict:
+    """Create a new page in the database with properties and content."""
+    return await _create_page(client, {"database_id": database_id},
+                              properties, blocks)
+
+
+async def update_page_properties(client: AsyncClient, page_id: str,
+                                 properties: dict) -> dict:
+    """Update a page's properties."""
+    return await client.pages.update(page_id=page_id, properties=properties)
+
+
+async def replace_page_content(client: AsyncClient, page_id: str,
+                               new_blocks: list[dict]) -> dict[str, Any]:
+    """
+    Clear a page's content (keeping child pages) and replace with new blocks.
+    Same tagging and result shape as notion_api.replace_page_content.
+    """
+    deletion = await delete_page_content(client, page_id)
+    if new_blocks:
+        created = await append_blocks(client, page_id, new_blocks)
+        for block, created_block in zip(new_blocks, created):
+            block["id"] = created_block["id"]
+    return {
+        "kept": 0,
+        "updated": 0,
+        "inserted": len(new_blocks),
+        "deleted": deletion["deleted"],
+        "delete_failed": deletion["failed"],
+        "delete_seconds": deletion["seconds"],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Child pages (archives and redlines)
+# ---------------------------------------------------------------------------
+
+
+async def create_child_page(client: AsyncClient, parent_page_id: str,
+                            title: str, blocks: Iterable[dict]) -> dict:
+    """
+    Create a child page under the given parent page.
+
+    `blocks` may be a generator: the first batch goes with the create call
+    and the rest are appended batch by batch as they are produced.
+    """
+    return await _create_page(
+        client,
+        {"page_id": parent_page_id},
+        {"title": [{"text": {"content": title}}]},
+        blocks,
+    )
+
+
+async def create_archive_page(client: AsyncClient, parent_page_id: str,
+                              doc_uid: str, revision: str,
+                              content_blocks: list[dict]) -> dict:
+    """Create an archive child page with a snapshot of content."""
+    title = f"Archive: {doc_uid} v{revision}"
+    logger.info("Creating archive page: %s", title)
+    return await create_child_page(client, parent_page_id, title, content_blocks)
+
+
+async def create_redline_page(client: AsyncClient, parent_page_id: str,
+                              doc_uid: str, prev_rev: str, new_rev: str,
+                              redline_blocks: Iterable[dict]) -> dict:
+    """Create a redline child page with the diff content."""
+    title = f"Redline: {doc_uid} v{prev_rev} \u2192 v{new_rev}"
+    logger.info("Creating redline page: %s", title)
+    return await create_child_page(client, parent_page_id, title, redline_blocks)
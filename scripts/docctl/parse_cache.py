@@ -0,0 +1,214 @@
+"""
+On-disk cache of parsed frontmatter.
+
+Parsing YAML frontmatter dominates validation time on a large docs tree,
+and most files are unchanged from one CI run to the next. The cache
+stores each file's parsed metadata and the offsets of its Markdown body,
+keyed by path and a SHA-256 of the file's contents, so only files whose
+bytes changed are parsed again. Entries are evicted least-recently-used
+once the cache grows past its size limit.
+
+Each entry also keeps the document's link/image/heading scan once it has
+been computed, so validating an unchanged file doesn't need its
+markdown-it token stream at all.
+
+The cache lives in docs/.meta/parse-cache.json (ignored by Git, restored
+by the CI workflows). Its header records a fingerprint of the code that
+produced the entries (the frontmatter splitter, the markdown-it setup,
+the scanner and their libraries); a cache written by different code is
+dropped, so a parser fix never runs on stale scans.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from .frontmatter import ParsedDoc, split_frontmatter
+from .scan import MarkdownScan
+
+logger = logging.getLogger(__name__)
+
+PARSE_CACHE_FILE = "parse-cache.json"
+PARSE_CACHE_VERSION = 2
+PARSE_CACHE_MAX_ENTRIES = 4096
+
+# Modules and distributions whose output is stored in the cache
+_PARSER_MODULES = ("frontmatter.py", "markdown_parser.py", "scan.py",
+                   "parse_cache.py")
+_PARSER_DISTRIBUTIONS = ("PyYAML", "markdown-it-py", "mdit-py-plugins")
+
+
+def _code_fingerprint() -> str:
+    """Hash of the parsing code and library versions behind cache entries."""
+    digest = hashlib.sha256()
+    package_dir = Path(__file__).resolve().parent
+    for name in _PARSER_MODULES:
+        digest.update(name.encode())
+        digest.update((package_dir / name).read_bytes())
+    for dist in _PARSER_DISTRIBUTIONS:
+        try:
+            version = metadata.version(dist)
+        except metadata.PackageNotFoundError:
+            version = ""
+        digest.update(f"{dist}=={version}".encode())
+    return digest.hexdigest()
+
+
+def _scan_from_json(data: dict[str, list]) -> MarkdownScan:
+    return MarkdownScan(
+        links=[tuple(link) for link in data["links"]],
+        images=[tuple(image) for image in data["images"]],
+        headings=list(data["headings"]),
+    )
+
+
+class ParseCache:
+    """Parsed frontmatter keyed by (path, content hash), with LRU eviction."""
+
+    def __init__(self, cache_file: Path, root: Path,
+                 max_entries: int = PARSE_CACHE_MAX_ENTRIES):
+        self.cache_file = cache_file
+        self.root = root
+        self.max_entries = max_entries
+        self.code = _code_fingerprint()
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict[str, Any]] = {}
+        # Docs whose entry has no scan yet; filled in on save if computed
+        self._unscanned: dict[str, ParsedDoc] = {}
+        # Hits of this run; applied to the entries only when the file is
+        # rewritten anyway, so a warm run doesn't rewrite it
+        self._used: dict[str, int] = {}
+        self._clock = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, cache_file: Path, root: Path,
+             max_entries: int = PARSE_CACHE_MAX_ENTRIES) -> ParseCache:
+        """Open the cache file; a missing or unreadable file starts empty."""
+        cache = cls(cache_file, root, max_entries)
+        if not cache_file.is_file():
+            return cache
+        try:
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable parse cache %s: %s",
+                           cache_file.name, e)
+            return cache
+        if (data.get("version") != PARSE_CACHE_VERSION
+                or data.get("code") != cache.code):
+            logger.info("Parse cache %s was written by other code; starting fresh",
+                        cache_file.name)
+            cache._dirty = True  # replace it even if nothing else changes
+            return cache
+        cache._entries = data.get("entries", {})
+        cache._clock = data.get("clock", 0)
+        return cache
+
+    def _key(self, path: Path, digest: str) -> str:
+        try:
+            rel = path.resolve().relative_to(self.root.resolve()).as_posix()
+        except ValueError:
+            rel = path.resolve().as_posix()
+        return f"{rel}:{digest}"
+
+    def parse(self, path: Path) -> ParsedDoc:
+        """Parse a Markdown file, reusing the cached result if its bytes match."""
+        raw = path.read_bytes()
+        key = self._key(path, hashlib.sha256(raw).hexdigest())
+        # Same newline handling as reading the file in text mode
+        text = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+        with self._lock:
+            self._clock += 1
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._used[key] = self._clock
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if entry is not None:
+            start, end = entry["body"]
+            doc = ParsedDoc(
+                path=path,
+                metadata=json.loads(entry["metadata"]),
+                content=text[start:end],
+            )
+            if "scan" in entry:
+                doc.scan = _scan_from_json(entry["scan"])
+            else:
+                self._remember(key, doc)
+            return doc
+
+        metadata, start, end = split_frontmatter(text)
+        doc = ParsedDoc(path=path, metadata=metadata, content=text[start:end])
+        if self._store(key, metadata, start, end):
+            self._remember(key, doc)
+        return doc
+
+    def _remember(self, key: str, doc: ParsedDoc) -> None:
+        with self._lock:
+            self._unscanned[key] = doc
+
+    def _store(self, key: str, metadata: dict[str, Any],
+               start: int, end: int) -> bool:
+        try:
+            encoded = json.dumps(metadata, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return False  # e.g. YAML dates; not worth caching
+        if json.loads(encoded) != metadata:
+            return False
+
+        with self._lock:
+            self._entries[key] = {
+                "metadata": encoded,
+                "body": [start, end],
+                "used": self._clock,
+            }
+            self._dirty = True
+        return True
+
+    def save(self) -> None:
+        """Evict least-recently-used entries and write the cache (atomically)."""
+        with self._lock:
+            for key, doc in self._unscanned.items():
+                # Record scans computed during this run; never parse just to fill them in
+                if "scan" in doc.__dict__ and key in self._entries:
+                    self._entries[key]["scan"] = asdict(doc.scan)
+                    self._dirty = True
+            self._unscanned.clear()
+            if len(self._entries) > self.max_entries:
+                self._dirty = True
+            if not self._dirty:
+                return
+            for key, used in self._used.items():
+                if key in self._entries:
+                    self._entries[key]["used"] = used
+            if len(self._entries) > self.max_entries:
+                keep = sorted(self._entries.items(),
+                              key=lambda item: item[1]["used"],
+                              reverse=True)[:self.max_entries]
+                self._entries = dict(keep)
+            data = {
+                "version": PARSE_CACHE_VERSION,
+                "code": self.code,
+                "clock": self._clock,
+                "entries": self._entries,
+            }
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_file.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.cache_file)
+            self._dirty = False
+        logger.info("Parse cache: %d hit(s), %d miss(es)",
+                    self.hits, self.misses)
@@ -15,22 +15,24 @@ from __future__ import annotations
 
 import logging
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from notion_client import Client
 
 from .config import PipelineConfig
-from .frontmatter import ParsedDoc, parse_doc, parse_all_docs
-from .md_to_notion import markdown_to_blocks, _text
+from .corpus import DocCorpus
+from .frontmatter import ParsedDoc, parse_doc_text
+from .md_to_notion import PageMentionIndex, markdown_to_blocks, _text
 from .notion_api import (
     get_client,
     query_page_by_uid,
+    query_page_index,
     get_page_blocks,
-    get_page_revision,
-    get_page_status,
-    get_page_sha,
+    get_page_state,
     build_page_properties,
     build_revision_history_table,
     build_revision_history_row,
@@ -40,12 +42,14 @@ from .notion_api import (
     replace_page_content,
     create_archive_page,
     create_redline_page,
-    delete_all_blocks,
     append_blocks,
+    snapshot_blocks,
 )
 from .redline import build_redline_blocks
+from .state import cached_page_blocks, load_publish_state, save_publish_state
+from .sync import sync_page_content
 from .uid import assign_uid, commit_uid_assignment
-from .validate import validate_doc
+from .validate import LinkIndex, validate_doc
 
 logger = logging.getLogger(__name__)
 
@@ -82,21 +86,18 @@ def compute_next_revision(current_rev: str, is_release: bool) -> str:
 # ---------------------------------------------------------------------------
 
 
-def build_page_id_lookup(client: Client, database_id: str,
-                         all_docs: list[ParsedDoc]) -> dict[str, str]:
+def build_page_id_lookup(client: Client,
+                         database_id: str) -> dict[str, dict]:
     """
-    Build a mapping from doc_uid -> Notion page ID for all published docs.
-    Used for resolving internal links.
+    Build an index of doc_uid -> page state for all published docs.
+
+    One paginated sweep of the Documents database replaces a per-document
+    query. Each entry holds page_id, revision, status and sha; used both
+    for resolving internal links and for planning each publish.
     """
-    lookup: dict[str, str] = {}
-    for doc in all_docs:
-        uid = doc.doc_uid
-        if not uid or uid == "auto":
-            continue
-        page = query_page_by_uid(client, database_id, uid)
-        if page:
-            lookup[uid] = page["id"]
-    return lookup
+    index = query_page_index(client, database_id)
+    logger.info("Indexed %d page(s) in the Documents database", len(index))
+    return index
 
 
 # ---------------------------------------------------------------------------
@@ -104,7 +105,8 @@ def build_page_id_lookup(client: Client, database_id: str,
 # ---------------------------------------------------------------------------
 
 
-def get_changed_docs(config: PipelineConfig) -> list[Path]:
+def get_changed_docs(config: PipelineConfig,
+                     corpus: DocCorpus | None = None) -> list[Path]:
     """
     Determine which docs changed in the current push.
     Falls back to all docs if git diff fails.
@@ -129,25 +131,39 @@ def get_changed_docs(config: PipelineConfig) -> list[Path]:
         logger.warning("git diff failed; falling back to all docs")
 
     # Fallback: return all docs
-    return [d.path for d in parse_all_docs(config.docs_dir)]
+    if corpus is None:
+        corpus = DocCorpus.load(config.docs_dir)
+    return corpus.paths
 
 
 # ---------------------------------------------------------------------------
-# Reconstruct previous markdown from archive
+# Reconstruct previous markdown
 # ---------------------------------------------------------------------------
 
 
-def get_previous_markdown(client: Client, page_id: str,
-                          current_revision: str) -> str:
+def get_previous_markdown(config: PipelineConfig, git_sha: str,
+                          source_path: str) -> str | None:
     """
-    Get the markdown content of the previous version by reading the
-    current page blocks before they're replaced.
+    Get the Markdown body of the previously published version from Git.
 
-    Since we always archive before replacing, we read the current
-    page content. This is called BEFORE the page is cleared.
+    Reads `source_path` at `git_sha` (the page's Git Commit SHA) from the
+    local repository, so the redline compares Markdown with Markdown.
+    Returns None if that commit or file isn't available locally (e.g. a
+    shallow clone, or a page published before SHAs were recorded).
     """
-    blocks = get_page_blocks(client, page_id)
-    return _blocks_to_plain_text(blocks)
+    if not git_sha or not source_path:
+        return None
+    try:
+        result = subprocess.run(
+            ["git", "show", f"{git_sha}:{source_path}"],
+            cwd=config.repo_root,
+            capture_output=True, text=True, check=True,
+        )
+    except subprocess.CalledProcessError:
+        logger.warning("%s not found at commit %s; falling back to page text",
+                       source_path, git_sha[:8])
+        return None
+    return parse_doc_text(result.stdout, config.repo_root / source_path).content
 
 
 def _blocks_to_plain_text(blocks: list[dict]) -> str:
@@ -190,11 +206,8 @@ def _blocks_to_plain_text(blocks: list[dict]) -> str:
             lines.append("---")
 
         elif btype == "table":
-            # Tables are complex; extract row text
+            # Rows come with the table from get_page_blocks(recursive=True)
             children = block.get("children", data.get("children", []))
-            if not children:
-                # Need to fetch children separately if not included
-                pass
             for row_block in children:
                 row_data = row_block.get("table_row", {})
                 cells = row_data.get("cells", [])
@@ -220,7 +233,8 @@ def _blocks_to_plain_text(blocks: list[dict]) -> str:
 def _parse_existing_history_rows(blocks: list[dict]) -> list[list[list[dict]]]:
     """
     Extract revision history rows from the first table in the page blocks.
-    Returns the data rows (excluding header).
+    Returns the data rows (excluding header), as copies that can be
+    edited without touching `blocks`.
     """
     for block in blocks:
         if block.get("type") == "table":
@@ -233,7 +247,7 @@ def _parse_existing_history_rows(blocks: list[dict]) -> list[list[list[dict]]]:
                 if i == 0:
                     continue  # Skip header row
                 cells = row_block.get("table_row", {}).get("cells", [])
-                rows.append(cells)
+                rows.append(list(cells))
             return rows
     return []
 
@@ -243,73 +257,62 @@ def _parse_existing_history_rows(blocks: list[dict]) -> list[list[list[dict]]]:
 # ---------------------------------------------------------------------------
 
 
-def publish_doc(
-    doc: ParsedDoc,
-    config: PipelineConfig,
-    client: Client,
-    is_release: bool = False,
-    all_docs: list[ParsedDoc] | None = None,
-    page_id_lookup: dict[str, str] | None = None,
-) -> dict[str, Any]:
-    """
-    Publish a single document. Returns a result dict with status info.
+@dataclass
+class PublishPlan:
+    """What publish_doc decided to write, before any Notion write happens."""
 
-    This is the heart of the pipeline:
-    1. Handle auto-UID assignment
-    2. Query for existing canonical page
-    3. Compute next revision
-    4. Check idempotency
-    5. Archive current content (if updating)
-    6. Generate redline (if updating)
-    7. Convert markdown to Notion blocks
-    8. Create or update the canonical page
-    9. Build and prepend revision history table
-    10. Add footer
-    """
-    result: dict[str, Any] = {
-        "doc_uid": doc.doc_uid,
-        "file": str(doc.path.name),
-        "status": "unknown",
-    }
+    doc: ParsedDoc
+    doc_uid: str
+    existing_page: dict | None
+    current_rev: str
+    current_sha: str
+    next_rev: str
+    status_label: str
+    content_hash: str
+    source_path: str
+    properties: dict
+    content_blocks: list[dict]
+    today: str
 
-    # --- Step 1: Auto-UID ---
-    doc_uid = doc.doc_uid
-    if doc.needs_auto_uid:
-        doc_uid = assign_uid(doc, client, config)
-        commit_uid_assignment(doc.path, doc_uid, config)
-        # Re-parse the file after write-back
-        doc = parse_doc(doc.path)
-        result["doc_uid"] = doc_uid
-        result["auto_assigned"] = True
 
-    # --- Eligibility check ---
+def _skip_reason(doc: ParsedDoc, is_release: bool) -> str | None:
+    """Why a document is not eligible for this publish, or None."""
     if not doc.publish:
-        result["status"] = "skipped"
-        result["reason"] = "publish is false"
-        return result
-
+        return "publish is false"
     desired = doc.desired_state
     if is_release and desired != "release":
-        result["status"] = "skipped"
-        result["reason"] = f"desired_state is '{desired}', not 'release'"
-        return result
+        return f"desired_state is '{desired}', not 'release'"
     if not is_release and desired not in ("draft", "release"):
-        result["status"] = "skipped"
-        result["reason"] = f"desired_state is '{desired}'"
-        return result
+        return f"desired_state is '{desired}'"
+    return None
+
 
-    # --- Step 2: Query for canonical page ---
-    existing_page = query_page_by_uid(client, config.notion_database_id, doc_uid)
+def plan_publish(
+    doc: ParsedDoc,
+    doc_uid: str,
+    config: PipelineConfig,
+    is_release: bool,
+    existing_page: dict | None,
+    mentions: PageMentionIndex | None,
+    result: dict[str, Any],
+) -> PublishPlan | None:
+    """
+    Compute the next revision and build the page payload (steps 3-7).
 
+    Returns None, with `result` filled in as a no-op, if the page already
+    has this commit or this content.
+    """
     # --- Step 3: Compute revision ---
     if existing_page:
-        current_rev = get_page_revision(existing_page)
-        current_status = get_page_status(existing_page)
-        current_sha = get_page_sha(existing_page)
+        current_rev = existing_page["revision"]
+        current_status = existing_page["status"]
+        current_sha = existing_page["sha"]
+        current_hash = existing_page["content_hash"]
     else:
         current_rev = "0.0"
         current_status = ""
         current_sha = ""
+        current_hash = ""
 
     next_rev = compute_next_revision(current_rev, is_release)
     status_label = "Released" if is_release else "Draft"
@@ -323,7 +326,20 @@ def publish_doc(
         result["revision"] = current_rev
         logger.info("%s: already published (rev %s, sha %s) — skipping",
                     doc_uid, current_rev, config.git_commit_sha[:8])
-        return result
+        return None
+
+    # Unchanged content needs no new revision, unless a release has to
+    # promote a draft
+    content_hash = doc.content_hash
+    if (existing_page
+            and current_hash == content_hash
+            and (not is_release or current_status == "Released")):
+        result["status"] = "no-op"
+        result["reason"] = f"content unchanged since v{current_rev}"
+        result["revision"] = current_rev
+        logger.info("%s: content unchanged since v%s — skipping",
+                    doc_uid, current_rev)
+        return None
 
     logger.info(
         "Publishing %s: %s -> %s (%s)",
@@ -332,7 +348,7 @@ def publish_doc(
 
     # --- Step 5: Convert markdown to Notion blocks ---
     raw_url_base = config.raw_content_base_url
-    content_blocks = markdown_to_blocks(doc, page_id_lookup, raw_url_base)
+    content_blocks = markdown_to_blocks(doc, mentions, raw_url_base)
 
     # --- Step 6: Build properties ---
     source_path = str(doc.path.relative_to(config.repo_root))
@@ -352,111 +368,289 @@ def publish_doc(
         if config.gitea_url else "",
         source_path=source_path,
         format_profile=doc.format_profile,
+        content_hash=content_hash,
+    )
+
+    return PublishPlan(
+        doc=doc,
+        doc_uid=doc_uid,
+        existing_page=existing_page,
+        current_rev=current_rev,
+        current_sha=current_sha,
+        next_rev=next_rev,
+        status_label=status_label,
+        content_hash=content_hash,
+        source_path=source_path,
+        properties=properties,
+        content_blocks=content_blocks,
+        today=datetime.now(timezone.utc).strftime("%Y-%m-%d"),
+    )
+
+
+def _page_blocks(plan: PublishPlan, config: PipelineConfig,
+                 history_table: dict) -> list[dict]:
+    """The full page: history table + content + footer."""
+    footer = build_footer_blocks(config.git_commit_sha, config.git_pr_url)
+    return [history_table] + plan.content_blocks + footer
+
+
+def _first_history_table(plan: PublishPlan) -> dict:
+    """Revision history for a first publish: one row."""
+    history_row = build_revision_history_row(
+        revision=plan.next_rev,
+        status=plan.status_label,
+        date=plan.today,
     )
+    return build_revision_history_table([history_row])
 
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+def _previous_markdown(plan: PublishPlan, config: PipelineConfig,
+                       current_blocks: list[dict]) -> str:
+    """The previous revision's Markdown, or the page text if Git lacks it."""
+    old_markdown = get_previous_markdown(
+        config, plan.current_sha,
+        plan.existing_page.get("source_path") or plan.source_path,
+    )
+    if old_markdown is None:
+        old_markdown = _blocks_to_plain_text(current_blocks)
+    return old_markdown
+
+
+def _plan_redline_blocks(plan: PublishPlan, config: PipelineConfig,
+                         old_markdown: str) -> Iterable[dict] | None:
+    """Redline blocks for an update, or None if there is no prior revision."""
+    if plan.current_rev == "0.0":
+        return None
+    return build_redline_blocks(
+        doc_uid=plan.doc_uid,
+        prev_revision=plan.current_rev,
+        new_revision=plan.next_rev,
+        old_markdown=old_markdown,
+        new_markdown=plan.doc.content,
+        git_sha=config.git_commit_sha,
+        pr_url=config.git_pr_url,
+        mode=config.redline_mode,
+    )
+
+
+def _updated_history_table(plan: PublishPlan,
+                           existing_history: list[list[list[dict]]],
+                           archive_page_id: str,
+                           redline_page_id: str | None) -> dict:
+    """Prepend the new revision's row and link the previous one to its archive."""
+    current_rev, next_rev = plan.current_rev, plan.next_rev
+    new_row = build_revision_history_row(
+        revision=next_rev,
+        status=plan.status_label,
+        date=plan.today,
+        redline_page_id=redline_page_id,
+        redline_label=f"v{current_rev} \u2192 v{next_rev}" if redline_page_id else "",
+        # Current version has no archive link (it IS the live page)
+        archive_page_id=None,
+        archive_label="",
+    )
+
+    # Update the previous "current" row to include its archive link
+    if existing_history:
+        # The first data row was the previous "current" — add archive link
+        prev_row = existing_history[0]
+        if len(prev_row) >= 5:
+            prev_row[4] = [{
+                "type": "text",
+                "text": {
+                    "content": f"v{current_rev}",
+                    "link": {"url": f"/{archive_page_id}"},
+                },
+            }]
+
+    return build_revision_history_table([new_row] + existing_history)
+
+
+def _create_archive(client: Client, plan: PublishPlan, page_id: str,
+                    current_blocks: list[dict]) -> str:
+    """Snapshot the current content as an archive child page; its id."""
+    archive_page = create_archive_page(
+        client, page_id, plan.doc_uid, plan.current_rev,
+        snapshot_blocks(current_blocks),
+    )
+    logger.info("%s: archived v%s as child page %s",
+                plan.doc_uid, plan.current_rev, archive_page["id"])
+    return archive_page["id"]
+
+
+def _create_redline(client: Client, plan: PublishPlan, config: PipelineConfig,
+                    page_id: str, current_blocks: list[dict]) -> str | None:
+    """Diff against the previous revision as a redline child page; its id."""
+    old_markdown = _previous_markdown(plan, config, current_blocks)
+    redline_blocks = _plan_redline_blocks(plan, config, old_markdown)
+    if redline_blocks is None:
+        return None
+    redline_page = create_redline_page(
+        client, page_id, plan.doc_uid, plan.current_rev, plan.next_rev,
+        redline_blocks,
+    )
+    logger.info("%s: created redline v%s -> v%s as child page %s",
+                plan.doc_uid, plan.current_rev, plan.next_rev,
+                redline_page["id"])
+    return redline_page["id"]
+
+
+def record_publish(plan: PublishPlan, config: PipelineConfig,
+                   page_id: str, all_blocks: list[dict]) -> None:
+    """Save the published page to the local publish-state cache."""
+    save_publish_state(config.meta_dir, plan.doc_uid, {
+        "doc_uid": plan.doc_uid,
+        "page_id": page_id,
+        "revision": plan.next_rev,
+        "status": plan.status_label,
+        "content_hash": plan.content_hash,
+        "git_sha": config.git_commit_sha,
+        "blocks": [
+            {**block, "has_children": bool(block[block["type"]].get("children"))}
+            for block in all_blocks
+        ],
+    })
+
+    logger.info(
+        "%s: published as %s v%s",
+        plan.doc_uid, plan.status_label, plan.next_rev,
+    )
+
+
+def publish_doc(
+    doc: ParsedDoc,
+    config: PipelineConfig,
+    client: Client,
+    is_release: bool = False,
+    corpus: DocCorpus | None = None,
+    mentions: PageMentionIndex | None = None,
+    page_index: dict[str, dict] | None = None,
+    verify_remote: bool = False,
+) -> dict[str, Any]:
+    """
+    Publish a single document. Returns a result dict with status info.
+
+    This is the heart of the pipeline:
+    1. Handle auto-UID assignment
+    2. Look up the existing canonical page (from page_index if given)
+    3. Compute next revision
+    4. Check idempotency (same commit, or unchanged content hash)
+    5. Archive current content (if updating; read from the local publish
+       state cache unless it is stale or verify_remote is set)
+    6. Generate redline (if updating)
+    7. Convert markdown to Notion blocks
+    8. Create or update the canonical page
+    9. Build and prepend revision history table
+    10. Add footer
+
+    On an update, the archive and redline pages are created
+    concurrently. The content write waits for both, since the history
+    table links them, and the archive holds the only other copy of the
+    old content. Properties are updated last, so a failed write is
+    retried by the next run.
+
+    Steps 3-7 are shared with publish_async.publish_doc_async through
+    plan_publish; this function only adds the Notion reads and writes.
+    """
+    result: dict[str, Any] = {
+        "doc_uid": doc.doc_uid,
+        "file": str(doc.path.name),
+        "status": "unknown",
+    }
+
+    # --- Step 1: Auto-UID ---
+    doc_uid = doc.doc_uid
+    if doc.needs_auto_uid:
+        if corpus is None:
+            corpus = DocCorpus.load(config.docs_dir)
+        doc_uid = assign_uid(doc, client, config, corpus)
+        commit_uid_assignment(doc.path, doc_uid, config)
+        # Re-parse the file after write-back
+        doc = corpus.get(doc.path)
+        result["doc_uid"] = doc_uid
+        result["auto_assigned"] = True
+
+    # --- Eligibility check ---
+    reason = _skip_reason(doc, is_release)
+    if reason:
+        result["status"] = "skipped"
+        result["reason"] = reason
+        return result
+
+    # --- Step 2: Look up canonical page ---
+    if page_index is not None:
+        existing_page = page_index.get(doc_uid)
+    else:
+        page = query_page_by_uid(client, config.notion_database_id, doc_uid)
+        existing_page = get_page_state(page) if page else None
+
+    plan = plan_publish(doc, doc_uid, config, is_release, existing_page,
+                        mentions, result)
+    if plan is None:
+        return result
 
     if existing_page is None:
         # ===== FIRST PUBLISH =====
         logger.info("%s: first publish — creating canonical page", doc_uid)
 
-        # Build revision history with one row
-        history_row = build_revision_history_row(
-            revision=next_rev,
-            status=status_label,
-            date=today,
-        )
-        history_table = build_revision_history_table([history_row])
-
-        # Assemble full page: history table + content + footer
-        footer = build_footer_blocks(config.git_commit_sha, config.git_pr_url)
-        all_blocks = [history_table] + content_blocks + footer
-
+        all_blocks = _page_blocks(plan, config, _first_history_table(plan))
         page = create_page(client, config.notion_database_id,
-                           properties, all_blocks)
+                           plan.properties, all_blocks)
+        page_id = page["id"]
 
         result["status"] = "created"
-        result["revision"] = next_rev
+        result["revision"] = plan.next_rev
         result["notion_page_id"] = page["id"]
         result["notion_url"] = page.get("url", "")
 
     else:
         # ===== SUBSEQUENT PUBLISH =====
-        page_id = existing_page["id"]
+        page_id = existing_page["page_id"]
+        current_rev, next_rev = plan.current_rev, plan.next_rev
         logger.info("%s: updating canonical page %s", doc_uid, page_id)
 
         # Read current content for archiving and diffing
-        current_blocks = get_page_blocks(client, page_id)
-        old_markdown = _blocks_to_plain_text(current_blocks)
+        current_blocks = None
+        if not verify_remote:
+            current_blocks = cached_page_blocks(
+                load_publish_state(config.meta_dir, doc_uid), existing_page,
+            )
+        if current_blocks is not None:
+            logger.info("%s: using cached content of v%s", doc_uid, current_rev)
+        else:
+            current_blocks = get_page_blocks(client, page_id, recursive=True)
 
         # Parse existing revision history rows
         existing_history = _parse_existing_history_rows(current_blocks)
 
-        # Archive current content
-        archive_page = create_archive_page(
-            client, page_id, doc_uid, current_rev, current_blocks,
-        )
-        archive_page_id = archive_page["id"]
-        logger.info("%s: archived v%s as child page %s",
-                    doc_uid, current_rev, archive_page_id)
-
-        # Generate redline
-        redline_page_id = None
-        if current_rev != "0.0":
-            new_markdown = doc.content
-            redline_blocks = build_redline_blocks(
-                doc_uid=doc_uid,
-                prev_revision=current_rev,
-                new_revision=next_rev,
-                old_markdown=old_markdown,
-                new_markdown=new_markdown,
-                git_sha=config.git_commit_sha,
-                pr_url=config.git_pr_url,
-            )
-            redline_page = create_redline_page(
-                client, page_id, doc_uid, current_rev, next_rev,
-                redline_blocks,
-            )
-            redline_page_id = redline_page["id"]
-            logger.info("%s: created redline v%s -> v%s as child page %s",
-                        doc_uid, current_rev, next_rev, redline_page_id)
+        # Archive and redline are independent child pages
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            archive = pool.submit(_create_archive, client, plan, page_id,
+                                  current_blocks)
+            redline = pool.submit(_create_redline, client, plan, config,
+                                  page_id, current_blocks)
+            archive_page_id = archive.result()
+            redline_page_id = redline.result()
 
         # Build new revision history
-        new_row = build_revision_history_row(
-            revision=next_rev,
-            status=status_label,
-            date=today,
-            redline_page_id=redline_page_id,
-            redline_label=f"v{current_rev} \u2192 v{next_rev}" if redline_page_id else "",
-            # Current version has no archive link (it IS the live page)
-            archive_page_id=None,
-            archive_label="",
+        history_table = _updated_history_table(
+            plan, existing_history, archive_page_id, redline_page_id,
         )
 
-        # Update the previous "current" row to include its archive link
-        if existing_history:
-            # The first data row was the previous "current" — add archive link
-            prev_row = existing_history[0]
-            if len(prev_row) >= 5:
-                prev_row[4] = [{
-                    "type": "text",
-                    "text": {
-                        "content": f"v{current_rev}",
-                        "link": {"url": f"/{archive_page_id}"},
-                    },
-                }]
-
-        all_history_rows = [new_row] + existing_history
-        history_table = build_revision_history_table(all_history_rows)
+        # Write new content: reconcile block-by-block, or clear and rewrite
+        all_blocks = _page_blocks(plan, config, history_table)
 
-        # Clear page and write new content
-        footer = build_footer_blocks(config.git_commit_sha, config.git_pr_url)
-        all_blocks = [history_table] + content_blocks + footer
-
-        replace_page_content(client, page_id, all_blocks)
+        if config.content_sync == "replace":
+            result["content_sync"] = replace_page_content(
+                client, page_id, all_blocks,
+            )
+        else:
+            result["content_sync"] = sync_page_content(
+                client, page_id, all_blocks, current_blocks,
+            )
 
         # Update properties
-        update_page_properties(client, page_id, properties)
+        update_page_properties(client, page_id, plan.properties)
 
         result["status"] = "updated"
         result["revision"] = next_rev
@@ -465,10 +659,7 @@ def publish_doc(
         result["archive_page_id"] = archive_page_id
         result["redline_page_id"] = redline_page_id
 
-    logger.info(
-        "%s: published as %s v%s",
-        doc_uid, status_label, next_rev,
-    )
+    record_publish(plan, config, page_id, all_blocks)
     return result
 
 
@@ -477,15 +668,104 @@ def publish_doc(
 # ---------------------------------------------------------------------------
 
 
+def validate_for_publish(doc: ParsedDoc, config: PipelineConfig,
+                         corpus: DocCorpus,
+                         link_index: LinkIndex) -> dict[str, Any] | None:
+    """Validate a document before publishing; an error result if it fails."""
+    validation = validate_doc(doc, corpus, config, link_index)
+    if not validation.ok:
+        logger.error(
+            "%s: validation failed:\n  %s",
+            doc.path.name, "\n  ".join(validation.errors),
+        )
+        return {
+            "doc_uid": doc.doc_uid,
+            "file": doc.path.name,
+            "status": "error",
+            "errors": validation.errors,
+        }
+
+    if validation.warnings:
+        for warn in validation.warnings:
+            logger.warning("  %s", warn)
+    return None
+
+
+def _publish_path(
+    path: Path,
+    config: PipelineConfig,
+    client: Client,
+    is_release: bool,
+    corpus: DocCorpus,
+    link_index: LinkIndex,
+    mentions: PageMentionIndex,
+    page_index: dict[str, dict],
+    verify_remote: bool,
+) -> dict[str, Any]:
+    """Parse, validate and publish one file. Never raises."""
+    try:
+        doc = corpus.get(path)
+
+        failure = validate_for_publish(doc, config, corpus, link_index)
+        if failure:
+            return failure
+
+        return publish_doc(
+            doc=doc,
+            config=config,
+            client=client,
+            is_release=is_release,
+            corpus=corpus,
+            mentions=mentions,
+            page_index=page_index,
+            verify_remote=verify_remote,
+        )
+
+    except Exception:
+        logger.exception("Failed to publish %s", path.name)
+        return {
+            "file": str(path.name),
+            "status": "error",
+            "reason": "unhandled exception",
+        }
+
+
+def _needs_serial_publish(path: Path, corpus: DocCorpus) -> bool:
+    """
+    True if a file must be published outside the worker pool.
+
+    Auto-UID documents write back to the file and commit, so they run one
+    at a time. Unparseable files go serial too; _publish_path reports them.
+    """
+    try:
+        return corpus.get(path).needs_auto_uid
+    except Exception:
+        return True
+
+
 def publish_changed_docs(
     config: PipelineConfig,
     is_release: bool = False,
     doc_paths: list[Path] | None = None,
+    jobs: int = 1,
+    verify_remote: bool = False,
+    corpus: DocCorpus | None = None,
 ) -> list[dict[str, Any]]:
     """
     Publish all changed (or specified) documents.
 
-    Returns a list of result dicts, one per document processed.
+    With jobs > 1, documents are published concurrently on a thread pool
+    of that size; documents needing auto-UID assignment are still
+    published serially first.
+
+    Returns a list of result dicts, one per document processed, in the
+    same order as the input paths.
+
+    With verify_remote, current page content is always read from Notion
+    rather than from the local publish-state cache in docs/.meta.
+
+    Every document under docs/ is parsed once per run; pass a corpus that
+    is already loaded to share it with the caller.
     """
     client = get_client(config)
 
@@ -495,64 +775,49 @@ def publish_changed_docs(
                      config.bot_commit_author)
         return [{"status": "skipped", "reason": "bot commit"}]
 
+    # Parse all docs once: cross-references, UID assignment, publishing
+    if corpus is None:
+        corpus = DocCorpus.load(config.docs_dir)
+
     # Determine which files to process
     if doc_paths:
         paths = doc_paths
     else:
-        paths = get_changed_docs(config)
+        paths = get_changed_docs(config, corpus)
 
     if not paths:
         logger.info("No changed docs to publish")
         return []
 
-    # Parse all docs for cross-reference
-    all_docs = parse_all_docs(config.docs_dir)
-
-    # Build page ID lookup for link resolution
-    page_id_lookup = build_page_id_lookup(
-        client, config.notion_database_id, all_docs
-    )
-
-    results: list[dict[str, Any]] = []
-    for path in paths:
-        try:
-            doc = parse_doc(path)
-
-            # Validate before publishing
-            validation = validate_doc(doc, all_docs, config)
-            if not validation.ok:
-                logger.error(
-                    "%s: validation failed:\n  %s",
-                    path.name, "\n  ".join(validation.errors),
-                )
-                results.append({
-                    "doc_uid": doc.doc_uid,
-                    "file": path.name,
-                    "status": "error",
-                    "errors": validation.errors,
-                })
-                continue
-
-            if validation.warnings:
-                for warn in validation.warnings:
-                    logger.warning("  %s", warn)
-
-            pub_result = publish_doc(
-                doc=doc,
-                config=config,
-                client=client,
-                is_release=is_release,
-                all_docs=all_docs,
-                page_id_lookup=page_id_lookup,
-            )
-            results.append(pub_result)
+    link_index = LinkIndex.build(config, corpus)
 
-        except Exception:
-            logger.exception("Failed to publish %s", path.name)
-            results.append({
-                "file": str(path.name),
-                "status": "error",
-                "reason": "unhandled exception",
-            })
-
-    return results
+    # Index existing pages once: link resolution + per-doc page state
+    page_index = build_page_id_lookup(client, config.notion_database_id)
+    page_id_lookup = {
+        uid: entry["page_id"] for uid, entry in page_index.items()
+    }
+    mentions = PageMentionIndex.build(link_index.doc_uids, page_id_lookup)
+
+    def publish_one(path: Path) -> dict[str, Any]:
+        return _publish_path(path, config, client, is_release,
+                             corpus, link_index, mentions, page_index,
+                             verify_remote)
+
+    if jobs <= 1:
+        return [publish_one(path) for path in paths]
+
+    results: list[dict[str, Any] | None] = [None] * len(paths)
+    parallel: list[int] = []
+    for i, path in enumerate(paths):
+        if _needs_serial_publish(path, corpus):
+            results[i] = publish_one(path)
+        else:
+            parallel.append(i)
+
+    logger.info("Publishing %d doc(s) with %d worker(s)", len(parallel), jobs)
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(publish_one, paths[i]): i for i in parallel}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    return [r for r in results if r is not None]
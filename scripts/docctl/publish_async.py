@@ -0,0 +1,349 @@
+"""
+Asyncio publishing on the notion_async API layer.
+
+publish_doc_async makes the same decisions as publish.publish_doc (it
+shares plan_publish and the page-building helpers) but awaits its Notion
+requests, so publish_changed_docs_async can keep many documents'
+requests in flight over one keep-alive connection pool. Most of a
+publish is network latency, which overlaps here instead of adding up.
+
+Two steps stay synchronous and run on the sync client, sharing the async
+client's rate limiter: auto-UID assignment, which writes back and
+commits files one at a time, and block-level content sync
+(sync.sync_page_content), which runs on a worker thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any
+
+from notion_client import AsyncClient, Client
+
+from .config import PipelineConfig
+from .corpus import DocCorpus
+from .frontmatter import ParsedDoc
+from .md_to_notion import PageMentionIndex
+from .notion_api import get_client, get_page_state, snapshot_blocks
+from .notion_async import (
+    get_async_client,
+    query_page_by_uid,
+    query_page_index,
+    get_page_blocks,
+    create_page,
+    update_page_properties,
+    replace_page_content,
+    create_archive_page,
+    create_redline_page,
+)
+from .publish import (
+    PublishPlan,
+    _first_history_table,
+    _needs_serial_publish,
+    _page_blocks,
+    _parse_existing_history_rows,
+    _plan_redline_blocks,
+    _previous_markdown,
+    _publish_path,
+    _skip_reason,
+    _updated_history_table,
+    get_changed_docs,
+    plan_publish,
+    record_publish,
+    validate_for_publish,
+)
+from .state import cached_page_blocks, load_publish_state
+from .sync import sync_page_content
+from .validate import LinkIndex
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Core publish logic
+# ---------------------------------------------------------------------------
+
+
+async def _create_archive(client: AsyncClient, plan: PublishPlan,
+                          page_id: str, current_blocks: list[dict]) -> str:
+    """Snapshot the current content as an archive child page; its id."""
+    archive_page = await create_archive_page(
+        client, page_id, plan.doc_uid, plan.current_rev,
+        snapshot_blocks(current_blocks),
+    )
+    logger.info("%s: archived v%s as child page %s",
+                plan.doc_uid, plan.current_rev, archive_page["id"])
+    return archive_page["id"]
+
+
+async def _create_redline(client: AsyncClient, plan: PublishPlan,
+                          config: PipelineConfig, page_id: str,
+                          current_blocks: list[dict]) -> str | None:
+    """Diff against the previous revision as a redline child page; its id."""
+    # Reads the old revision with `git show`
+    old_markdown = await asyncio.to_thread(
+        _previous_markdown, plan, config, current_blocks,
+    )
+    redline_blocks = _plan_redline_blocks(plan, config, old_markdown)
+    if redline_blocks is None:
+        return None
+    redline_page = await create_redline_page(
+        client, page_id, plan.doc_uid, plan.current_rev, plan.next_rev,
+        redline_blocks,
+    )
+    logger.info("%s: created redline v%s -> v%s as child page %s",
+                plan.doc_uid, plan.current_rev, plan.next_rev,
+                redline_page["id"])
+    return redline_page["id"]
+
+
+async def publish_doc_async(
+    doc: ParsedDoc,
+    config: PipelineConfig,
+    client: AsyncClient,
+    is_release: bool = False,
+    mentions: PageMentionIndex | None = None,
+    page_index: dict[str, dict] | None = None,
+    verify_remote: bool = False,
+    sync_client: Client | None = None,
+) -> dict[str, Any]:
+    """
+    Publish a single document; the async counterpart of publish_doc.
+
+    Like publish_doc, an update creates the archive and redline pages
+    concurrently, then writes the content and finally the properties.
+
+    Documents that need auto-UID assignment must go through publish_doc,
+    which writes the UID back and commits it. `sync_client` is used for
+    block-level content sync; by default one is created that shares
+    `client`'s rate limiter.
+    """
+    if doc.needs_auto_uid:
+        raise ValueError(f"{doc.path.name} needs a doc_uid; "
+                         f"publish it with publish.publish_doc")
+
+    doc_uid = doc.doc_uid
+    result: dict[str, Any] = {
+        "doc_uid": doc_uid,
+        "file": str(doc.path.name),
+        "status": "unknown",
+    }
+
+    # --- Eligibility check ---
+    reason = _skip_reason(doc, is_release)
+    if reason:
+        result["status"] = "skipped"
+        result["reason"] = reason
+        return result
+
+    # --- Look up canonical page ---
+    if page_index is not None:
+        existing_page = page_index.get(doc_uid)
+    else:
+        page = await query_page_by_uid(client, config.notion_database_id, doc_uid)
+        existing_page = get_page_state(page) if page else None
+
+    plan = plan_publish(doc, doc_uid, config, is_release, existing_page,
+                        mentions, result)
+    if plan is None:
+        return result
+
+    if existing_page is None:
+        # ===== FIRST PUBLISH =====
+        logger.info("%s: first publish — creating canonical page", doc_uid)
+
+        all_blocks = _page_blocks(plan, config, _first_history_table(plan))
+        page = await create_page(client, config.notion_database_id,
+                                 plan.properties, all_blocks)
+        page_id = page["id"]
+
+        result["status"] = "created"
+        result["revision"] = plan.next_rev
+        result["notion_page_id"] = page["id"]
+        result["notion_url"] = page.get("url", "")
+
+    else:
+        # ===== SUBSEQUENT PUBLISH =====
+        page_id = existing_page["page_id"]
+        current_rev, next_rev = plan.current_rev, plan.next_rev
+        logger.info("%s: updating canonical page %s", doc_uid, page_id)
+
+        # Read current content for archiving and diffing
+        current_blocks = None
+        if not verify_remote:
+            current_blocks = cached_page_blocks(
+                load_publish_state(config.meta_dir, doc_uid), existing_page,
+            )
+        if current_blocks is not None:
+            logger.info("%s: using cached content of v%s", doc_uid, current_rev)
+        else:
+            current_blocks = await get_page_blocks(client, page_id,
+                                                   recursive=True)
+        existing_history = _parse_existing_history_rows(current_blocks)
+
+        # Archive and redline are independent child pages; the old
+        # content is only cleared once both exist
+        archive_page_id, redline_page_id = await asyncio.gather(
+            _create_archive(client, plan, page_id, current_blocks),
+            _create_redline(client, plan, config, page_id, current_blocks),
+        )
+
+        history_table = _updated_history_table(
+            plan, existing_history, archive_page_id, redline_page_id,
+        )
+        all_blocks = _page_blocks(plan, config, history_table)
+
+        if config.content_sync == "replace":
+            result["content_sync"] = await replace_page_content(
+                client, page_id, all_blocks,
+            )
+        else:
+            if sync_client is None:
+                sync_client = get_client(config, client.bucket)
+            result["content_sync"] = await asyncio.to_thread(
+                sync_page_content, sync_client, page_id, all_blocks,
+                current_blocks,
+            )
+
+        await update_page_properties(client, page_id, plan.properties)
+
+        result["status"] = "updated"
+        result["revision"] = next_rev
+        result["previous_revision"] = current_rev
+        result["notion_page_id"] = page_id
+        result["archive_page_id"] = archive_page_id
+        result["redline_page_id"] = redline_page_id
+
+    record_publish(plan, config, page_id, all_blocks)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Batch publish
+# ---------------------------------------------------------------------------
+
+
+async def _publish_path_async(
+    path: Path,
+    config: PipelineConfig,
+    client: AsyncClient,
+    sync_client: Client,
+    is_release: bool,
+    corpus: DocCorpus,
+    link_index: LinkIndex,
+    mentions: PageMentionIndex,
+    page_index: dict[str, dict],
+    verify_remote: bool,
+) -> dict[str, Any]:
+    """Validate and publish one parsed file. Never raises."""
+    try:
+        doc = corpus.get(path)
+
+        failure = validate_for_publish(doc, config, corpus, link_index)
+        if failure:
+            return failure
+
+        return await publish_doc_async(
+            doc=doc,
+            config=config,
+            client=client,
+            is_release=is_release,
+            mentions=mentions,
+            page_index=page_index,
+            verify_remote=verify_remote,
+            sync_client=sync_client,
+        )
+
+    except Exception:
+        logger.exception("Failed to publish %s", path.name)
+        return {
+            "file": str(path.name),
+            "status": "error",
+            "reason": "unhandled exception",
+        }
+
+
+async def publish_changed_docs_async(
+    config: PipelineConfig,
+    is_release: bool = False,
+    doc_paths: list[Path] | None = None,
+    jobs: int = 8,
+    verify_remote: bool = False,
+    corpus: DocCorpus | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Publish all changed (or specified) documents on one event loop.
+
+    Same inputs and results as publish.publish_changed_docs, but up to
+    `jobs` documents are in flight at once over a shared connection pool.
+    Documents needing auto-UID assignment are published first, one at a
+    time, with the sync client.
+    """
+    sync_client = get_client(config)
+    client = get_async_client(config, sync_client.bucket)
+    try:
+        return await _publish_all(config, client, sync_client, is_release,
+                                  doc_paths, jobs, verify_remote, corpus)
+    finally:
+        await client.aclose()
+
+
+async def _publish_all(
+    config: PipelineConfig,
+    client: AsyncClient,
+    sync_client: Client,
+    is_release: bool,
+    doc_paths: list[Path] | None,
+    jobs: int,
+    verify_remote: bool,
+    corpus: DocCorpus | None,
+) -> list[dict[str, Any]]:
+    # Skip bot commits to prevent infinite loops
+    if config.git_actor == config.bot_commit_author:
+        logger.info("Skipping pipeline — commit by bot account '%s'",
+                     config.bot_commit_author)
+        return [{"status": "skipped", "reason": "bot commit"}]
+
+    if corpus is None:
+        corpus = DocCorpus.load(config.docs_dir)
+
+    paths = doc_paths or get_changed_docs(config, corpus)
+    if not paths:
+        logger.info("No changed docs to publish")
+        return []
+
+    link_index = LinkIndex.build(config, corpus)
+
+    page_index = await query_page_index(client, config.notion_database_id)
+    logger.info("Indexed %d page(s) in the Documents database", len(page_index))
+    page_id_lookup = {
+        uid: entry["page_id"] for uid, entry in page_index.items()
+    }
+    mentions = PageMentionIndex.build(link_index.doc_uids, page_id_lookup)
+
+    results: list[dict[str, Any] | None] = [None] * len(paths)
+    concurrent: list[int] = []
+    for i, path in enumerate(paths):
+        if _needs_serial_publish(path, corpus):
+            results[i] = await asyncio.to_thread(
+                _publish_path, path, config, sync_client, is_release,
+                corpus, link_index, mentions, page_index, verify_remote,
+            )
+        else:
+            concurrent.append(i)
+
+    logger.info("Publishing %d doc(s), up to %d at a time",
+                len(concurrent), jobs)
+    limit = asyncio.Semaphore(max(1, jobs))
+
+    async def publish_one(i: int) -> None:
+        async with limit:
+            results[i] = await _publish_path_async(
+                paths[i], config, client, sync_client, is_release,
+                corpus, link_index, mentions, page_index, verify_remote,
+            )
+
+    await asyncio.gather(*(publish_one(i) for i in concurrent))
+    return [r for r in results if r is not None]
@@ -0,0 +1,271 @@
+"""
+Client-side rate limiting and retries for the Notion API.
+
+Every request made through the clients returned by `notion_api.get_client`
+and `notion_async.get_async_client` draws from one shared token bucket,
+so concurrent publishes stay inside the integration's request budget.
+429s are retried with jittered exponential back-off; a `Retry-After`
+header, when present, pauses the whole bucket rather than just the
+caller that saw it. 5xx responses and timeouts are retried only for
+idempotent requests: a create or append may have been applied before
+it failed, and sending it again would duplicate pages or blocks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import re
+import threading
+import time
+from typing import Any
+
+from notion_client import AsyncClient, Client
+from notion_client.client import ClientOptions
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# How a Notion request fails: an HTTP error response or a timeout
+REQUEST_ERRORS = (HTTPResponseError, RequestTimeoutError)
+
+# Only two requests create something each time they are sent:
+# pages.create (POST pages) and blocks.children.append
+# (PATCH blocks/{id}/children). Every other request the pipeline makes,
+# including the read-only POSTs databases.query and search, may be
+# sent twice.
+IDEMPOTENT_METHODS = frozenset({"GET", "DELETE", "PATCH"})
+READ_ONLY_POSTS = re.compile(r"^/?(?:(?:databases|data_sources)/[^/]+/query|search)/?$")
+
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 30.0
+
+
+# ---------------------------------------------------------------------------
+# Token bucket
+# ---------------------------------------------------------------------------
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with an adaptive refill rate.
+
+    Threads block in `acquire`; coroutines await `acquire_async`. Both
+    draw from the same tokens, so sync and async clients can share one.
+
+    The rate halves on every throttling response and creeps back up to the
+    configured maximum on success (AIMD), so sustained 429s slow every
+    caller down instead of each one retrying at full speed.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None,
+                 min_rate: float = 0.25):
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def _take(self) -> float:
+        """Take a token and return 0, or return the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now >= self._paused_until and self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return max(self._paused_until - now,
+                       (1 - self._tokens) / self.rate)
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while wait := self._take():
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request may be sent."""
+        while wait := self._take():
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for `seconds` and drain the bucket."""
+        with self._lock:
+            self._paused_until = max(self._paused_until,
+                                     time.monotonic() + seconds)
+            self._tokens = 0.0
+
+    def throttled(self) -> None:
+        """Multiplicative decrease after a 429."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+        logger.info("Notion rate limit hit; throttling to %.2f req/s", self.rate)
+
+    def succeeded(self) -> None:
+        """Additive increase back toward the configured rate."""
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+# ---------------------------------------------------------------------------
+# Retry policy
+# ---------------------------------------------------------------------------
+
+
+def _retry_after_seconds(error: HTTPResponseError) -> float | None:
+    """Read a Retry-After header (delta-seconds form) from an API error."""
+    headers = getattr(error, "headers", None)
+    value = headers.get("retry-after") if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential back-off with jitter for the given retry attempt."""
+    ceiling = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt))
+    return random.uniform(ceiling / 2, ceiling)
+
+
+def is_idempotent(path: str, method: str) -> bool:
+    """True if sending the request twice has the same effect as once."""
+    method = method.upper()
+    if method == "POST":
+        return bool(READ_ONLY_POSTS.match(path))
+    if method not in IDEMPOTENT_METHODS:
+        return False
+    return not (method == "PATCH" and path.rstrip("/").endswith("/children"))
+
+
+def retry_delay(bucket: TokenBucket, error: Exception, attempt: int,
+                max_retries: int, idempotent: bool = True) -> float | None:
+    """
+    Seconds to wait before retrying a failed request, or None to give up.
+
+    A 429 is always retried (the request was not processed) and also
+    throttles and pauses the shared bucket. Timeouts and 5xx responses
+    are retried only if the request is `idempotent`.
+    """
+    if attempt >= max_retries:
+        return None
+
+    if isinstance(error, RequestTimeoutError):
+        if not idempotent:
+            return None
+        delay = backoff_delay(attempt)
+        logger.warning(
+            "Notion API request timed out; retry %d/%d in %.1fs",
+            attempt + 1, max_retries, delay,
+        )
+        return delay
+
+    if not isinstance(error, HTTPResponseError) \
+            or error.status not in RETRYABLE_STATUSES:
+        return None
+    if error.status != 429 and not idempotent:
+        return None
+    delay = _retry_after_seconds(error)
+    if delay is None:
+        delay = backoff_delay(attempt)
+    if error.status == 429:
+        bucket.throttled()
+        bucket.pause(delay)
+    logger.warning(
+        "Notion API returned %s; retry %d/%d in %.1fs",
+        error.status, attempt + 1, max_retries, delay,
+    )
+    return delay
+
+
+def _disable_sdk_retries(kwargs: dict[str, Any]) -> None:
+    # Newer SDKs retry internally, which would hide 429s from the bucket
+    if "retry" in getattr(ClientOptions, "__dataclass_fields__", {}):
+        kwargs.setdefault("retry", False)
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+class RateLimitedClient(Client):
+    """
+    Notion client whose every request passes through a shared TokenBucket
+    and is retried on 429, and on 5xx and timeouts when idempotent.
+    """
+
+    def __init__(self, bucket: TokenBucket, max_retries: int = 5,
+                 **kwargs: Any):
+        _disable_sdk_retries(kwargs)
+        super().__init__(**kwargs)
+        self.bucket = bucket
+        self.max_retries = max_retries
+
+    def request(self, path: str, method: str, *args: Any, **kwargs: Any) -> Any:
+        idempotent = is_idempotent(path, method)
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            try:
+                response = super().request(path, method, *args, **kwargs)
+            except REQUEST_ERRORS as e:
+                delay = retry_delay(self.bucket, e, attempt, self.max_retries,
+                                    idempotent)
+                if delay is None:
+                    raise
+            else:
+                self.bucket.succeeded()
+                return response
+
+            time.sleep(delay)
+            attempt += 1
+
+
+class RateLimitedAsyncClient(AsyncClient):
+    """
+    Async Notion client with the same shared TokenBucket and retry policy
+    as RateLimitedClient. Waiting for a token or a retry never blocks the
+    event loop.
+    """
+
+    def __init__(self, bucket: TokenBucket, max_retries: int = 5,
+                 **kwargs: Any):
+        _disable_sdk_retries(kwargs)
+        super().__init__(**kwargs)
+        self.bucket = bucket
+        self.max_retries = max_retries
+
+    async def request(self, path: str, method: str, *args: Any,
+                      **kwargs: Any) -> Any:
+        idempotent = is_idempotent(path, method)
+        attempt = 0
+        while True:
+            await self.bucket.acquire_async()
+            try:
+                response = await super().request(path, method, *args, **kwargs)
+            except REQUEST_ERRORS as e:
+                delay = retry_delay(self.bucket, e, attempt, self.max_retries,
+                                    idempotent)
+                if delay is None:
+                    raise
+            else:
+                self.bucket.succeeded()
+                return response
+
+            await asyncio.sleep(delay)
+            attempt += 1
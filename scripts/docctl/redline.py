@@ -5,112 +5,352 @@ Compares two versions of a Markdown document and produces a rich
 redline as Notion blocks: additions highlighted in green, deletions
 in red, and unchanged context in gray.
 
-Uses Python's built-in difflib for word-level and line-level diffs.
+Lines are aligned with Myers' O(ND) diff; in word mode, edited lines are
+diffed again at word level and shown inline in a single paragraph.
 """
 
 from __future__ import annotations
 
-import difflib
 import re
 from datetime import datetime, timezone
+from typing import Any, Iterator
 
-from .md_to_notion import _text, _paragraph_block, _heading_block, _divider_block
+from .md_to_notion import (
+    _text,
+    _paragraph_block,
+    _heading_block,
+    _divider_block,
+    _split_long_text,
+)
 
 
 # ---------------------------------------------------------------------------
-# Diff computation
+# Myers O(ND) diff
 # ---------------------------------------------------------------------------
 
+Opcode = tuple[str, int, int, int, int]
+
 
-def compute_line_diff(old_text: str, new_text: str) -> list[dict]:
+def _middle_snake(a: list[int], a0: int, a1: int,
+                  b: list[int], b0: int, b1: int) -> tuple[int, int, int, int]:
     """
-    Compute a line-by-line diff and return Notion blocks representing
-    the redline.
+    Find the middle snake of an optimal edit script (Myers 1986, 4b).
 
-    - Added lines: green background text
-    - Removed lines: red/strikethrough text
-    - Unchanged lines: gray text (context)
-    - Section headers preserved as headings
+    Returns (x, y, u, v): a[x:u] == b[y:v] lies on a shortest edit path
+    between a[a0:a1] and b[b0:b1], with coordinates relative to a0/b0.
     """
-    old_lines = old_text.splitlines(keepends=True)
-    new_lines = new_text.splitlines(keepends=True)
+    n, m = a1 - a0, b1 - b0
+    delta = n - m
+    odd = delta % 2 == 1
+    forward: dict[int, int] = {1: 0}
+    backward: dict[int, int] = {1: 0}
+
+    for d in range((n + m + 1) // 2 + 1):
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and forward[k - 1] < forward[k + 1]):
+                x = forward[k + 1]
+            else:
+                x = forward[k - 1] + 1
+            y = x - k
+            sx, sy = x, y
+            while x < n and y < m and a[a0 + x] == b[b0 + y]:
+                x += 1
+                y += 1
+            forward[k] = x
+            if odd and -(d - 1) <= delta - k <= d - 1:
+                if x + backward[delta - k] >= n:
+                    return sx, sy, x, y
+
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and backward[k - 1] < backward[k + 1]):
+                x = backward[k + 1]
+            else:
+                x = backward[k - 1] + 1
+            y = x - k
+            sx, sy = x, y
+            while x < n and y < m and a[a1 - 1 - x] == b[b1 - 1 - y]:
+                x += 1
+                y += 1
+            backward[k] = x
+            if not odd and -d <= delta - k <= d:
+                if x + forward[delta - k] >= n:
+                    return n - x, m - y, n - sx, m - sy
+
+    raise AssertionError("no middle snake")  # unreachable
+
+
+def _myers_matches(a: list[int], a0: int, a1: int, b: list[int], b0: int,
+                   b1: int, out: list[tuple[int, int, int]]) -> None:
+    """Append (i, j, size) matching runs of a[a0:a1] / b[b0:b1] to out."""
+    start_a, start_b = a0, b0
+    while a0 < a1 and b0 < b1 and a[a0] == b[b0]:
+        a0 += 1
+        b0 += 1
+    if a0 > start_a:
+        out.append((start_a, start_b, a0 - start_a))
+
+    suffix = 0
+    while a1 > a0 and b1 > b0 and a[a1 - 1] == b[b1 - 1]:
+        a1 -= 1
+        b1 -= 1
+        suffix += 1
+
+    if a0 < a1 and b0 < b1:
+        x, y, u, v = _middle_snake(a, a0, a1, b, b0, b1)
+        _myers_matches(a, a0, a0 + x, b, b0, b0 + y, out)
+        if u > x:
+            out.append((a0 + x, b0 + y, u - x))
+        _myers_matches(a, a0 + u, a1, b, b0 + v, b1, out)
+
+    if suffix:
+        out.append((a1, b1, suffix))
+
+
+def diff_opcodes(a: list, b: list) -> list[Opcode]:
+    """
+    Shortest-edit-script opcodes for two sequences, in the same format as
+    difflib.SequenceMatcher.get_opcodes().
 
-    differ = difflib.unified_diff(
-        old_lines, new_lines,
-        fromfile="previous", tofile="current",
-        lineterm="",
-    )
+    Uses Myers' linear-space O((N+M)D) algorithm, so cost grows with the
+    size of the change rather than quadratically with the input.
+    """
+    ids: dict[Any, int] = {}
+    a_ids = [ids.setdefault(x, len(ids)) for x in a]
+    b_ids = [ids.setdefault(x, len(ids)) for x in b]
+
+    matches: list[tuple[int, int, int]] = []
+    _myers_matches(a_ids, 0, len(a_ids), b_ids, 0, len(b_ids), matches)
+    matches.append((len(a), len(b), 0))
+
+    opcodes: list[Opcode] = []
+    i = j = 0
+    for ai, bj, size in matches:
+        if i < ai and j < bj:
+            opcodes.append(("replace", i, ai, j, bj))
+        elif i < ai:
+            opcodes.append(("delete", i, ai, j, bj))
+        elif j < bj:
+            opcodes.append(("insert", i, ai, j, bj))
+        if size:
+            if opcodes and opcodes[-1][0] == "equal":
+                _, i1, _, j1, _ = opcodes.pop()
+                opcodes.append(("equal", i1, ai + size, j1, bj + size))
+            else:
+                opcodes.append(("equal", ai, ai + size, bj, bj + size))
+        i, j = ai + size, bj + size
+    return opcodes
+
+
+def group_opcodes(opcodes: list[Opcode], context: int) -> Iterator[list[Opcode]]:
+    """Split opcodes into hunks with `context` lines around each change."""
+    if not opcodes:
+        return
+    codes = list(opcodes)
+    if codes[0][0] == "equal":
+        _, i1, i2, j1, j2 = codes[0]
+        codes[0] = ("equal", max(i1, i2 - context), i2, max(j1, j2 - context), j2)
+    if codes[-1][0] == "equal":
+        _, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = ("equal", i1, min(i2, i1 + context), j1, min(j2, j1 + context))
+
+    group: list[Opcode] = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > 2 * context:
+            group.append((tag, i1, i1 + context, j1, j1 + context))
+            yield group
+            group = []
+            i1, j1 = i2 - context, j2 - context
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
 
-    blocks: list[dict] = []
-    current_chunk: list[dict] = []
 
-    for line in differ:
-        # Skip diff headers
-        if line.startswith("---") or line.startswith("+++"):
-            continue
+# ---------------------------------------------------------------------------
+# Diff computation
+# ---------------------------------------------------------------------------
 
-        if line.startswith("@@"):
-            # Flush current chunk
-            if current_chunk:
-                blocks.append(_paragraph_block(current_chunk))
-                current_chunk = []
-            # Add chunk header as a divider
-            blocks.append(_divider_block())
-            blocks.append(_paragraph_block([
-                _text(line.strip(), {"italic": True, "color": "gray"})
-            ]))
-            continue
+DIFF_CONTEXT_LINES = 3
 
-        stripped = line.rstrip("\n")
+REDLINE_MODES = frozenset({"line", "word"})
 
-        if line.startswith("+"):
-            # Addition
-            if current_chunk:
-                blocks.append(_paragraph_block(current_chunk))
-                current_chunk = []
-            blocks.append(_paragraph_block([
-                _text("+ " + stripped[1:], {"color": "green"})
-            ]))
+# Words, runs of whitespace, and single punctuation characters
+WORD_TOKEN_RE = re.compile(r"\w+|\s+|[^\w\s]")
 
-        elif line.startswith("-"):
-            # Deletion
-            if current_chunk:
-                blocks.append(_paragraph_block(current_chunk))
-                current_chunk = []
-            blocks.append(_paragraph_block([
-                _text("- " + stripped[1:], {"strikethrough": True, "color": "red"})
-            ]))
+# Below this share of unchanged characters, a changed line is shown as a
+# whole removal plus a whole addition rather than inline word edits
+WORD_DIFF_MIN_SIMILARITY = 0.5
 
-        else:
-            # Context line
-            content = stripped[1:] if stripped.startswith(" ") else stripped
-            current_chunk.append(_text(content + "\n", {"color": "gray"}))
+# Notion allows at most 100 rich_text objects per block
+NOTION_MAX_RICH_TEXT_ITEMS = 100
 
-    if current_chunk:
-        blocks.append(_paragraph_block(current_chunk))
 
-    return blocks
+def word_diff_rich_text(old_line: str, new_line: str) -> list[dict] | None:
+    """
+    Render a changed line as one rich_text run list with inline edits:
+    removed words in red strikethrough, added words in green.
 
+    Returns None when the lines are too dissimilar for an inline diff to
+    be readable, or when the result would exceed Notion's rich_text limit.
+    """
+    old_tokens = WORD_TOKEN_RE.findall(old_line)
+    new_tokens = WORD_TOKEN_RE.findall(new_line)
+    opcodes = diff_opcodes(old_tokens, new_tokens)
 
-def compute_summary(old_text: str, new_text: str) -> dict[str, int]:
-    """Compute summary statistics for the diff."""
-    old_lines = old_text.splitlines()
-    new_lines = new_text.splitlines()
+    unchanged = sum(
+        len("".join(old_tokens[i1:i2]))
+        for tag, i1, i2, _, _ in opcodes if tag == "equal"
+    )
+    longest = max(len(old_line), len(new_line), 1)
+    if unchanged / longest < WORD_DIFF_MIN_SIMILARITY:
+        return None
+
+    runs: list[dict] = [_text("~ ", {"color": "gray"})]
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            runs.append(_text("".join(old_tokens[i1:i2])))
+            continue
+        if i2 > i1:
+            runs.append(_text("".join(old_tokens[i1:i2]),
+                              {"strikethrough": True, "color": "red"}))
+        if j2 > j1:
+            runs.append(_text("".join(new_tokens[j1:j2]), {"color": "green"}))
 
-    matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
-    added = 0
-    removed = 0
-    changed = 0
+    runs = _split_long_text(runs)
+    if len(runs) > NOTION_MAX_RICH_TEXT_ITEMS:
+        return None
+    return runs
 
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-        if tag == "insert":
-            added += j2 - j1
-        elif tag == "delete":
-            removed += i2 - i1
-        elif tag == "replace":
-            changed += max(i2 - i1, j2 - j1)
 
-    return {"added": added, "removed": removed, "changed": changed}
+class LineDiff:
+    """
+    A single line-level diff pass over two texts.
+
+    The Myers diff runs once; the summary counters and the redline blocks
+    are both derived from its opcodes, and the blocks are rendered lazily
+    so large redlines can be uploaded as they are produced.
+
+    In "word" mode, a changed line paired with its replacement is shown as
+    one paragraph with the word-level edits highlighted inline; in "line"
+    mode every changed line appears as a full removal plus a full addition.
+    """
+
+    def __init__(self, old_text: str, new_text: str, mode: str = "word"):
+        if mode not in REDLINE_MODES:
+            raise ValueError(
+                f"unknown redline mode '{mode}' "
+                f"(expected one of {sorted(REDLINE_MODES)})"
+            )
+        self.mode = mode
+        self.old_lines = old_text.splitlines()
+        self.new_lines = new_text.splitlines()
+        self.opcodes = diff_opcodes(self.old_lines, self.new_lines)
+
+    def summary(self) -> dict[str, int]:
+        """Count added, removed and changed lines."""
+        added = 0
+        removed = 0
+        changed = 0
+
+        for tag, i1, i2, j1, j2 in self.opcodes:
+            if tag == "insert":
+                added += j2 - j1
+            elif tag == "delete":
+                removed += i2 - i1
+            elif tag == "replace":
+                changed += max(i2 - i1, j2 - j1)
+
+        return {"added": added, "removed": removed, "changed": changed}
+
+    def blocks(self) -> Iterator[dict]:
+        """
+        Yield Notion blocks for the redline, hunk by hunk.
+
+        - Added lines: green text
+        - Removed lines: red strikethrough text
+        - Edited lines (word mode): inline red/green word changes
+        - Unchanged lines: gray text (context)
+        - Each hunk starts with a divider and its @@ range header
+        """
+        for group in group_opcodes(self.opcodes, DIFF_CONTEXT_LINES):
+            yield _divider_block()
+            yield _paragraph_block([
+                _text(_hunk_header(group), {"italic": True, "color": "gray"})
+            ])
+
+            context: list[dict] = []
+            for tag, i1, i2, j1, j2 in group:
+                if tag == "equal":
+                    for line in self.old_lines[i1:i2]:
+                        context.append(_text(line + "\n", {"color": "gray"}))
+                    continue
+
+                if context:
+                    yield _paragraph_block(context)
+                    context = []
+                yield from self._change_blocks(self.old_lines[i1:i2],
+                                               self.new_lines[j1:j2])
+
+            if context:
+                yield _paragraph_block(context)
+
+    def _change_blocks(self, old: list[str], new: list[str]) -> Iterator[dict]:
+        """Render one changed region (deleted, inserted or replaced lines)."""
+        removed: list[dict] = []
+        added: list[dict] = []
+
+        for k in range(max(len(old), len(new))):
+            old_line = old[k] if k < len(old) else None
+            new_line = new[k] if k < len(new) else None
+
+            if self.mode == "word" and old_line and new_line:
+                inline = word_diff_rich_text(old_line, new_line)
+                if inline is not None:
+                    yield from removed
+                    yield from added
+                    removed, added = [], []
+                    yield _paragraph_block(inline)
+                    continue
+
+            if old_line is not None:
+                removed.append(_paragraph_block([
+                    _text("- " + old_line, {"strikethrough": True, "color": "red"})
+                ]))
+            if new_line is not None:
+                added.append(_paragraph_block([
+                    _text("+ " + new_line, {"color": "green"})
+                ]))
+
+        yield from removed
+        yield from added
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Unified-diff range notation ("start,length") for a hunk header."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _hunk_header(group: list[Opcode]) -> str:
+    first, last = group[0], group[-1]
+    old_range = _format_range(first[1], last[2])
+    new_range = _format_range(first[3], last[4])
+    return f"@@ -{old_range} +{new_range} @@"
+
+
+def compute_line_diff(old_text: str, new_text: str,
+                      mode: str = "line") -> list[dict]:
+    """Compute a line-by-line diff and return the redline as Notion blocks."""
+    return list(LineDiff(old_text, new_text, mode).blocks())
+
+
+def compute_summary(old_text: str, new_text: str) -> dict[str, int]:
+    """Compute summary statistics for the diff."""
+    return LineDiff(old_text, new_text).summary()
 
 
 # ---------------------------------------------------------------------------
@@ -126,24 +366,28 @@ def build_redline_blocks(
     new_markdown: str,
     git_sha: str = "",
     pr_url: str = "",
-) -> list[dict]:
+    mode: str = "word",
+) -> Iterator[dict]:
     """
-    Build the full set of Notion blocks for a redline child page.
+    Yield the Notion blocks for a redline child page.
 
     Structure:
     1. Summary heading with change stats
     2. Metadata (commit, PR, timestamp)
     3. Divider
-    4. Line-by-line diff blocks
+    4. Line-by-line diff blocks ("word" mode highlights edits inline)
+
+    Blocks are generated lazily from a single diff pass; pass the result
+    straight to create_child_page to upload it in chunks.
     """
-    blocks: list[dict] = []
-    stats = compute_summary(old_markdown, new_markdown)
+    diff = LineDiff(old_markdown, new_markdown, mode)
+    stats = diff.summary()
     ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
 
     # Title heading
-    blocks.append(_heading_block(1, [
+    yield _heading_block(1, [
         _text(f"Redline: {doc_uid} v{prev_revision} \u2192 v{new_revision}")
-    ]))
+    ])
 
     # Summary
     summary_parts = []
@@ -155,10 +399,10 @@ def build_redline_blocks(
         summary_parts.append(f"{stats['changed']} lines changed")
     summary_text = ", ".join(summary_parts) if summary_parts else "No changes detected"
 
-    blocks.append(_paragraph_block([
+    yield _paragraph_block([
         _text("Summary: ", {"bold": True}),
         _text(summary_text),
-    ]))
+    ])
 
     # Metadata
     meta_parts = [_text(f"Generated: {ts}")]
@@ -170,22 +414,22 @@ def build_redline_blocks(
             "type": "text",
             "text": {"content": "Pull Request", "link": {"url": pr_url}},
         })
-    blocks.append(_paragraph_block(meta_parts))
+    yield _paragraph_block(meta_parts)
 
-    blocks.append(_divider_block())
+    yield _divider_block()
 
     # Diff blocks
     if not old_markdown:
-        blocks.append(_paragraph_block([
+        yield _paragraph_block([
             _text("Initial version \u2014 no previous content to compare.", {"italic": True})
-        ]))
-    else:
-        diff_blocks = compute_line_diff(old_markdown, new_markdown)
-        if diff_blocks:
-            blocks.extend(diff_blocks)
-        else:
-            blocks.append(_paragraph_block([
-                _text("No differences detected.", {"italic": True})
-            ]))
-
-    return blocks
+        ])
+        return
+
+    emitted = False
+    for block in diff.blocks():
+        emitted = True
+        yield block
+    if not emitted:
+        yield _paragraph_block([
+            _text("No differences detected.", {"italic": True})
+        ])
@@ -0,0 +1,61 @@
+"""
+Links, images and headings of a document, read from its token stream.
+
+The scan walks the markdown-it tokens that the Notion converter also
+uses (`ParsedDoc.tokens`), so a link is validated exactly when it would
+be published as a link: nothing inside code spans or fenced blocks, and
+reference-style links and setext headings are included. The result is
+cached on ParsedDoc (`doc.scan`) and shared by every validator and the
+orphaned-image check.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from urllib.parse import unquote
+
+from markdown_it.token import Token
+
+
+@dataclass
+class MarkdownScan:
+    """Links, images and headings of a document, outside code."""
+
+    links: list[tuple[str, str]] = field(default_factory=list)   # (text, target)
+    images: list[tuple[str, str]] = field(default_factory=list)  # (alt, path)
+    headings: list[str] = field(default_factory=list)
+
+
+def scan_tokens(tokens: list[Token]) -> MarkdownScan:
+    """Collect links, images and headings from a block token stream."""
+    scan = MarkdownScan()
+    in_heading = False
+
+    for tok in tokens:
+        if tok.type == "heading_open":
+            in_heading = True
+            continue
+        if tok.type != "inline":
+            continue
+        if in_heading:
+            scan.headings.append(tok.content.strip())
+            in_heading = False
+
+        link_href: str | None = None
+        link_text: list[str] = []
+        for child in tok.children or []:
+            if child.type == "link_open":
+                link_href = child.attrGet("href") or ""
+                link_text = []
+            elif child.type == "link_close":
+                if link_href is not None:
+                    # markdown-it percent-encodes hrefs; report them as written
+                    scan.links.append(("".join(link_text), unquote(link_href)))
+                link_href = None
+            elif child.type == "image":
+                src = child.attrGet("src") or ""
+                scan.images.append((child.content, unquote(src)))
+            elif link_href is not None and child.type in ("text", "code_inline"):
+                link_text.append(child.content)
+
+    return scan
@@ -0,0 +1,68 @@
+"""
+Local publish-state cache.
+
+After each successful publish the pipeline writes `docs/.meta/<doc_uid>.json`
+with the page ID, revision, content hash, commit and the block list that
+was published. The next publish of that document can then plan its
+update and build its redline from this file instead of reading the page
+back from Notion.
+
+The cache is only trusted while it agrees with the page's properties in
+the Documents database; pass --verify-remote to always read live.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def _state_path(meta_dir: Path, doc_uid: str) -> Path:
+    return meta_dir / f"{doc_uid}.json"
+
+
+def load_publish_state(meta_dir: Path, doc_uid: str) -> dict[str, Any] | None:
+    """Read the cached publish state for a doc_uid, or None if absent/unreadable."""
+    path = _state_path(meta_dir, doc_uid)
+    if not path.is_file():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable publish state %s: %s", path.name, e)
+        return None
+
+
+def save_publish_state(meta_dir: Path, doc_uid: str,
+                       state: dict[str, Any]) -> None:
+    """Write the publish state for a doc_uid (atomically)."""
+    meta_dir.mkdir(parents=True, exist_ok=True)
+    path = _state_path(meta_dir, doc_uid)
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def cached_page_blocks(state: dict[str, Any] | None,
+                       page: dict | None) -> list[dict] | None:
+    """
+    Return the cached top-level blocks if they still describe `page`.
+
+    `page` is the page state from the Documents database index. The cache
+    is stale if the page ID, revision or content hash differ, or if any
+    block is missing its Notion block ID (e.g. right after page creation).
+    """
+    if not state or not page:
+        return None
+    for key in ("page_id", "revision", "content_hash"):
+        if state.get(key) != page.get(key):
+            return None
+    blocks = state.get("blocks") or []
+    if not blocks or not all(b.get("id") for b in blocks):
+        return None
+    return blocks
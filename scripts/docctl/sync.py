@@ -0,0 +1,316 @@
+"""
+Block-level reconciliation of Notion page content.
+
+Instead of deleting every block on a page and appending the whole
+document again, compare the blocks currently on the page with the newly
+converted blocks and issue only the updates, inserts and deletes needed
+to turn one into the other. Tables and nested list items are reconciled
+recursively, so editing a single table cell costs a single row update.
+
+Child pages (archives and redlines) live alongside the content blocks
+and are never touched.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from notion_client import Client
+
+from .notion_api import (
+    CHILD_PAGE_TYPES,
+    append_blocks,
+    delete_blocks,
+    get_page_blocks,
+    replace_page_content,
+)
+from .redline import diff_opcodes
+
+logger = logging.getLogger(__name__)
+
+# Blocks that are not page content and must survive a sync
+PRESERVED_TYPES = CHILD_PAGE_TYPES
+
+# Block types whose content can be changed in place with blocks.update
+UPDATABLE_TYPES = frozenset({
+    "paragraph", "heading_1", "heading_2", "heading_3", "quote", "callout",
+    "bulleted_list_item", "numbered_list_item", "to_do", "toggle", "code",
+    "table_row",
+})
+
+# Per-type fields (besides rich_text) that define a block's own content
+_CONTENT_FIELDS: dict[str, tuple[str, ...]] = {
+    "code": ("language", "caption"),
+    "callout": ("icon", "color"),
+    "to_do": ("checked", "color"),
+    "image": ("type", "external", "caption"),
+    "table": ("table_width", "has_column_header", "has_row_header"),
+}
+
+_DEFAULT_ANNOTATIONS = {
+    "bold": False, "italic": False, "strikethrough": False,
+    "underline": False, "code": False, "color": "default",
+}
+
+
+# ---------------------------------------------------------------------------
+# Block comparison
+# ---------------------------------------------------------------------------
+
+
+def _normalize_rich_text(rich_text: list[dict]) -> list[list]:
+    """
+    Reduce a rich_text array to comparable runs.
+
+    The API fills in default annotations and may merge or split adjacent
+    runs, so runs with identical styling and link are concatenated.
+    """
+    runs: list[list] = []
+    for rt in rich_text or []:
+        ann = {**_DEFAULT_ANNOTATIONS, **(rt.get("annotations") or {})}
+        style = [ann[k] for k in sorted(_DEFAULT_ANNOTATIONS)]
+
+        if rt.get("type") == "mention":
+            mention = rt.get("mention", {})
+            mtype = mention.get("type", "")
+            runs.append(["mention", mtype, mention.get(mtype, {}).get("id", ""),
+                         style])
+            continue
+
+        text = rt.get("text", {})
+        link = (text.get("link") or {}).get("url")
+        content = text.get("content", "")
+        if runs and runs[-1][0] == "text" and runs[-1][2:] == [link, style]:
+            runs[-1][1] += content
+        else:
+            runs.append(["text", content, link, style])
+    return runs
+
+
+def _block_signature(block: dict) -> str:
+    """A stable key for a block's own content, ignoring its children."""
+    btype = block.get("type", "")
+    data = block.get(btype) or {}
+    content: dict[str, Any] = {"type": btype}
+
+    if "rich_text" in data:
+        content["rich_text"] = _normalize_rich_text(data["rich_text"])
+        if btype not in ("code", "callout", "to_do"):
+            content["color"] = data.get("color", "default")
+    if btype == "table_row":
+        content["cells"] = [_normalize_rich_text(c) for c in data.get("cells", [])]
+    for key in _CONTENT_FIELDS.get(btype, ()):
+        value = data.get(key)
+        if key == "caption":
+            value = _normalize_rich_text(value or [])
+        elif key == "color":
+            value = value or "default"
+        content[key] = value
+
+    return json.dumps(content, sort_keys=True, ensure_ascii=False)
+
+
+def _new_children(block: dict) -> list[dict]:
+    btype = block.get("type", "")
+    return (block.get(btype) or {}).get("children", [])
+
+
+def _old_children(client: Client, old: dict) -> list[dict]:
+    """A page block's children: from a fetched tree if present, else listed."""
+    fetched = _new_children(old)
+    if fetched and all(child.get("id") for child in fetched):
+        return fetched
+    if old.get("has_children") or fetched:
+        return get_page_blocks(client, old["id"])
+    return []
+
+
+def _can_update(old: dict, new: dict) -> bool:
+    """True if `old` can be turned into `new` without recreating it."""
+    btype = old.get("type")
+    if btype != new.get("type"):
+        return False
+    if btype == "table":
+        return old["table"].get("table_width") == new["table"].get("table_width")
+    return btype in UPDATABLE_TYPES
+
+
+# ---------------------------------------------------------------------------
+# Planning
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Step:
+    """One block of the target layout: kept, updated in place, or inserted."""
+
+    action: str  # "keep" | "update" | "insert"
+    old: dict | None = None
+    new: dict | None = None
+    children: _Plan | None = None
+
+
+@dataclass
+class _Plan:
+    """The operations that reconcile one parent's children."""
+
+    steps: list[_Step] = field(default_factory=list)
+    deletes: list[str] = field(default_factory=list)
+
+
+def _pair(client: Client, plan: _Plan, old: dict, new: dict,
+          changed: bool) -> None:
+    """Plan an existing block that maps onto a new one, recursing into children."""
+    child_plan = None
+    new_children = _new_children(new)
+    old_children = _old_children(client, old)
+    if old_children or new_children:
+        child_plan = _plan_children(client, old_children, new_children)
+        if child_plan is None:
+            # Children can't be reconciled in place; rebuild the block
+            plan.deletes.append(old["id"])
+            plan.steps.append(_Step("insert", new=new))
+            return
+
+    action = "update" if changed else "keep"
+    plan.steps.append(_Step(action, old=old, new=new, children=child_plan))
+
+
+def _plan_children(client: Client, old_blocks: list[dict],
+                   new_blocks: list[dict]) -> _Plan | None:
+    """
+    Align existing blocks with new blocks and plan the operations.
+
+    Returns None if the new layout can't be reached in place: the API can
+    only insert after an existing block, so new blocks that would precede
+    every retained block have no anchor.
+    """
+    old_blocks = [b for b in old_blocks if b.get("type") not in PRESERVED_TYPES]
+    old_keys = [_block_signature(b) for b in old_blocks]
+    new_keys = [_block_signature(b) for b in new_blocks]
+
+    plan = _Plan()
+    # Same exact diff as redlines, so both agree on what changed
+    for tag, i1, i2, j1, j2 in diff_opcodes(old_keys, new_keys):
+        olds, news = old_blocks[i1:i2], new_blocks[j1:j2]
+
+        if tag == "equal":
+            for old, new in zip(olds, news):
+                _pair(client, plan, old, new, changed=False)
+            continue
+
+        # replace / insert / delete: pair positionally where possible
+        for k in range(max(len(olds), len(news))):
+            old = olds[k] if k < len(olds) else None
+            new = news[k] if k < len(news) else None
+            if old is not None and new is not None and _can_update(old, new):
+                changed = old_keys[i1 + k] != new_keys[j1 + k]
+                _pair(client, plan, old, new, changed=changed)
+                continue
+            if old is not None:
+                plan.deletes.append(old["id"])
+            if new is not None:
+                plan.steps.append(_Step("insert", new=new))
+
+    first_retained = next(
+        (i for i, s in enumerate(plan.steps) if s.action != "insert"), None
+    )
+    if first_retained:
+        return None
+
+    return plan
+
+
+# ---------------------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------------------
+
+
+def _update_payload(block: dict) -> dict:
+    """The type payload for blocks.update (no children, no fixed fields)."""
+    btype = block["type"]
+    data = {k: v for k, v in block[btype].items()
+            if k not in ("children", "table_width")}
+    return {btype: data}
+
+
+def _execute(client: Client, parent_id: str, plan: _Plan,
+             stats: dict[str, int], deletes: list[str]) -> None:
+    """Apply a plan's updates and inserts; collect its deletes for later."""
+    anchor: str | None = None
+    pending: list[dict] = []
+
+    def flush() -> None:
+        nonlocal anchor
+        if not pending:
+            return
+        created = append_blocks(client, parent_id, pending, after=anchor)
+        stats["inserted"] += len(pending)
+        for block, created_block in zip(pending, created):
+            block["id"] = created_block["id"]
+        if created:
+            anchor = created[-1]["id"]
+        pending.clear()
+
+    for step in plan.steps:
+        if step.action == "insert":
+            pending.append(step.new)
+            continue
+
+        flush()
+        step.new["id"] = step.old["id"]
+        if step.action == "update":
+            client.blocks.update(block_id=step.old["id"],
+                                 **_update_payload(step.new))
+            stats["updated"] += 1
+        else:
+            stats["kept"] += 1
+        if step.children is not None:
+            _execute(client, step.old["id"], step.children, stats, deletes)
+        anchor = step.old["id"]
+
+    flush()
+    deletes.extend(plan.deletes)
+
+
+def sync_page_content(client: Client, page_id: str, new_blocks: list[dict],
+                      current_blocks: list[dict] | None = None) -> dict[str, Any]:
+    """
+    Make a page's content match `new_blocks` with the fewest API writes.
+
+    `current_blocks` may be passed if the page's blocks were already
+    fetched; nested children that came with them (get_page_blocks with
+    recursive=True) are not listed again. Falls back to
+    replace_page_content when the layout can't be reached in place.
+    On return, each top-level block in `new_blocks` carries the "id" of
+    the page block it became.
+    Deletes run last, concurrently, once every insert has its anchor.
+    Returns counts of kept, updated, inserted and deleted blocks, plus
+    any delete failures and the time spent deleting.
+    """
+    if current_blocks is None:
+        current_blocks = get_page_blocks(client, page_id, recursive=True)
+
+    plan = _plan_children(client, current_blocks, new_blocks)
+    if plan is None:
+        logger.info("Page %s can't be reconciled in place; replacing content",
+                    page_id)
+        return replace_page_content(client, page_id, new_blocks)
+
+    stats: dict[str, Any] = {"kept": 0, "updated": 0, "inserted": 0}
+    deletes: list[str] = []
+    _execute(client, page_id, plan, stats, deletes)
+
+    deletion = delete_blocks(client, deletes)
+    stats["deleted"] = deletion["deleted"]
+    stats["delete_failed"] = deletion["failed"]
+    stats["delete_seconds"] = deletion["seconds"]
+    logger.info(
+        "Synced page %s: %d kept, %d updated, %d inserted, %d deleted",
+        page_id, stats["kept"], stats["updated"], stats["inserted"],
+        stats["deleted"],
+    )
+    return stats
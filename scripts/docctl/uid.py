@@ -15,7 +15,8 @@ from pathlib import Path
 from notion_client import Client
 
 from .config import PipelineConfig
-from .frontmatter import ParsedDoc, parse_all_docs, write_doc_uid
+from .corpus import DocCorpus
+from .frontmatter import ParsedDoc, write_doc_uid
 from .notion_api import query_all_uids
 
 logger = logging.getLogger(__name__)
@@ -48,7 +49,7 @@ def find_next_uid(prefix: str, existing_uids: list[str]) -> str:
 
 
 def collect_existing_uids(client: Client, database_id: str,
-                          prefix: str, docs_dir: Path) -> list[str]:
+                          prefix: str, corpus: DocCorpus) -> list[str]:
     """
     Collect all existing UIDs matching a prefix from both Notion and local files.
     This ensures we don't conflict with unpublished docs or Notion-native pages.
@@ -57,11 +58,7 @@ def collect_existing_uids(client: Client, database_id: str,
     notion_uids = query_all_uids(client, database_id, prefix=prefix)
 
     # From local Git files
-    local_uids: list[str] = []
-    for doc in parse_all_docs(docs_dir):
-        uid = doc.doc_uid
-        if uid and uid != "auto" and uid.startswith(prefix):
-            local_uids.append(uid)
+    local_uids = corpus.uids_with_prefix(prefix)
 
     # Union of both sources
     all_uids = list(set(notion_uids + local_uids))
@@ -73,14 +70,15 @@ def collect_existing_uids(client: Client, database_id: str,
 
 
 def assign_uid(doc: ParsedDoc, client: Client,
-               config: PipelineConfig) -> str:
+               config: PipelineConfig, corpus: DocCorpus) -> str:
     """
     Assign a doc_uid to a document with doc_uid: "auto".
 
     1. Determine the prefix from org, department, category.
     2. Query Notion + local files for existing UIDs with that prefix.
     3. Compute the next sequential number.
-    4. Write the UID back to the file.
+    4. Write the UID back to the file (and drop it from the corpus, so
+       the next lookup sees the new UID).
     5. Return the assigned UID.
     """
     if not doc.needs_auto_uid:
@@ -88,12 +86,13 @@ def assign_uid(doc: ParsedDoc, client: Client,
 
     prefix = doc.uid_prefix
     existing = collect_existing_uids(
-        client, config.notion_database_id, prefix, config.docs_dir
+        client, config.notion_database_id, prefix, corpus
     )
     new_uid = find_next_uid(prefix, existing)
 
     logger.info("Assigning doc_uid '%s' to %s", new_uid, doc.path.name)
     write_doc_uid(doc.path, new_uid)
+    corpus.invalidate(doc.path)
 
     return new_uid
 
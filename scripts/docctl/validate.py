@@ -5,11 +5,19 @@ image references, and optional format-profile section checks.
 
 from __future__ import annotations
 
-import re
+import logging
+import os
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 from .config import PipelineConfig
-from .frontmatter import ParsedDoc, ValidationResult, parse_all_docs, validate_frontmatter
+from .corpus import DocCorpus
+from .frontmatter import ParsedDoc, ValidationResult, validate_frontmatter
+from .scan import MarkdownScan
+
+logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Format profile section requirements
@@ -28,25 +36,6 @@ FORMAT_PROFILES: dict[str, list[str]] = {
     ],
 }
 
-# ---------------------------------------------------------------------------
-# Link patterns
-# ---------------------------------------------------------------------------
-
-# Markdown links: [text](url)
-MD_LINK_RE = re.compile(r"\[([^\]]*)\]\(([^)]+)\)")
-# Markdown images: ![alt](path)
-MD_IMAGE_RE = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
-# Heading: ## Heading Text
-HEADING_RE = re.compile(r"^#{1,6}\s+(.+)$", re.MULTILINE)
-# Fenced code block
-CODE_FENCE_RE = re.compile(r"^```[^\n]*\n.*?^```", re.MULTILINE | re.DOTALL)
-
-
-def _strip_code_blocks(content: str) -> str:
-    """Remove fenced code blocks so regexes don't match inside examples."""
-    return CODE_FENCE_RE.sub("", content)
-
-
 # ---------------------------------------------------------------------------
 # Link validation
 # ---------------------------------------------------------------------------
@@ -62,35 +51,56 @@ def _resolve_relative_link(doc_path: Path, target: str, docs_dir: Path) -> Path
     return resolved
 
 
-def validate_links(doc: ParsedDoc, all_docs: list[ParsedDoc],
-                   config: PipelineConfig) -> ValidationResult:
-    """Validate all links in a document."""
-    result = ValidationResult()
-    rel = doc.path.name
+@dataclass
+class LinkIndex:
+    """
+    Repo files and doc_uids by path, built once per validation run so that
+    resolving a link or image reference is a string join plus a set lookup.
+
+    Paths are normalized lexically (os.path.normpath), not with
+    Path.resolve(), so no filesystem calls are needed per reference.
+    """
 
-    doc_uids_by_path: dict[Path, str] = {}
-    for d in all_docs:
-        doc_uids_by_path[d.path.resolve()] = d.doc_uid
+    files: set[str]
+    doc_uids: dict[str, str]
 
-    content = _strip_code_blocks(doc.content)
+    @classmethod
+    def build(cls, config: PipelineConfig, corpus: DocCorpus) -> LinkIndex:
+        files: set[str] = set()
+        for dirpath, dirnames, filenames in os.walk(config.repo_root):
+            # Skip .git and other hidden trees; lookups there fall back to disk
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            files.update(os.path.join(dirpath, name) for name in filenames)
+        doc_uids = {os.path.normpath(d.path): d.doc_uid for d in corpus.docs}
+        return cls(files=files, doc_uids=doc_uids)
 
-    for match in MD_LINK_RE.finditer(content):
-        link_text, target = match.group(1), match.group(2)
+    @staticmethod
+    def resolve(doc_path: Path, target: str) -> str:
+        """The normalized absolute path a relative reference points to."""
+        return os.path.normpath(os.path.join(os.path.dirname(doc_path), target))
 
-        # Skip image links (handled separately)
-        if doc.content[match.start() - 1:match.start()] == "!":
-            continue
+    def exists(self, path: str) -> bool:
+        # Only a miss (normally a broken reference) touches the disk
+        return path in self.files or os.path.isfile(path)
 
+
+def validate_links(doc: ParsedDoc, index: LinkIndex) -> ValidationResult:
+    """Validate all links in a document."""
+    result = ValidationResult()
+    rel = doc.path.name
+
+    # Links and images are scanned separately (doc.scan), skipping code
+    for link_text, target in doc.scan.links:
         # Internal repo link (relative .md path)
         if target.endswith(".md") and not target.startswith("http"):
-            resolved = (doc.path.parent / target).resolve()
-            if not resolved.exists():
+            resolved = index.resolve(doc.path, target)
+            if not index.exists(resolved):
                 result.error(
                     f"{rel}: broken internal link [{link_text}]({target}) — "
                     f"target file does not exist"
                 )
-            elif resolved in doc_uids_by_path:
-                target_uid = doc_uids_by_path[resolved]
+            elif resolved in index.doc_uids:
+                target_uid = index.doc_uids[resolved]
                 if not target_uid or target_uid == "auto":
                     result.warn(
                         f"{rel}: internal link [{link_text}]({target}) points "
@@ -124,30 +134,28 @@ def validate_links(doc: ParsedDoc, all_docs: list[ParsedDoc],
 # ---------------------------------------------------------------------------
 
 
-def validate_images(doc: ParsedDoc, config: PipelineConfig) -> ValidationResult:
+def validate_images(doc: ParsedDoc, index: LinkIndex) -> ValidationResult:
     """Validate all image references in a document."""
     result = ValidationResult()
     rel = doc.path.name
 
-    content = _strip_code_blocks(doc.content)
-
-    for match in MD_IMAGE_RE.finditer(content):
-        alt_text, img_path = match.group(1), match.group(2)
+    for alt_text, img_path in doc.scan.images:
 
         # External image URLs are fine
         if img_path.startswith("http://") or img_path.startswith("https://"):
             continue
 
-        resolved = (doc.path.parent / img_path).resolve()
-        if not resolved.exists():
+        resolved = index.resolve(doc.path, img_path)
+        suffix = os.path.splitext(resolved)[1]
+        if not index.exists(resolved):
             result.error(
                 f"{rel}: broken image reference ![{alt_text}]({img_path}) — "
                 f"file does not exist"
             )
-        elif not resolved.suffix.lower() in (".png", ".jpg", ".jpeg", ".gif",
-                                               ".svg", ".webp", ".bmp"):
+        elif not suffix.lower() in (".png", ".jpg", ".jpeg", ".gif",
+                                     ".svg", ".webp", ".bmp"):
             result.warn(
-                f"{rel}: unusual image extension: {resolved.suffix}"
+                f"{rel}: unusual image extension: {suffix}"
             )
 
     return result
@@ -173,7 +181,7 @@ def validate_format_profile(doc: ParsedDoc) -> ValidationResult:
         )
         return result
 
-    headings = [m.group(1).strip() for m in HEADING_RE.finditer(doc.content)]
+    headings = doc.scan.headings
     heading_lower = [h.lower() for h in headings]
 
     for section in required_sections:
@@ -228,15 +236,13 @@ def validate_orphaned_images(docs: list[ParsedDoc],
     for ext in ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp"):
         image_files.update(config.images_dir.glob(ext))
 
-    referenced: set[Path] = set()
+    referenced: set[str] = set()
     for doc in docs:
-        for match in MD_IMAGE_RE.finditer(doc.content):
-            img_path = match.group(2)
+        for _, img_path in doc.scan.images:
             if not img_path.startswith("http"):
-                resolved = (doc.path.parent / img_path).resolve()
-                referenced.add(resolved)
+                referenced.add(LinkIndex.resolve(doc.path, img_path))
 
-    orphans = image_files - referenced
+    orphans = {p for p in image_files if os.path.normpath(p) not in referenced}
     for orphan in sorted(orphans):
         result.warn(f"Orphaned image: {orphan.relative_to(config.repo_root)}")
 
@@ -248,36 +254,167 @@ def validate_orphaned_images(docs: list[ParsedDoc],
 # ---------------------------------------------------------------------------
 
 
-def validate_doc(doc: ParsedDoc, all_docs: list[ParsedDoc],
-                 config: PipelineConfig) -> ValidationResult:
-    """Run all validations on a single document."""
+def validate_doc(doc: ParsedDoc, corpus: DocCorpus, config: PipelineConfig,
+                 index: LinkIndex | None = None) -> ValidationResult:
+    """
+    Run all validations on a single document.
+
+    Pass the LinkIndex when validating many documents; building it walks
+    the repo.
+    """
+    if index is None:
+        index = LinkIndex.build(config, corpus)
+    return _check_doc(doc, index)
+
+
+def _check_doc(doc: ParsedDoc, index: LinkIndex) -> ValidationResult:
+    """The per-document checks (no cross-document state besides index)."""
     result = validate_frontmatter(doc)
-    result.merge(validate_links(doc, all_docs, config))
-    result.merge(validate_images(doc, config))
+    result.merge(validate_links(doc, index))
+    result.merge(validate_images(doc, index))
     result.merge(validate_format_profile(doc))
     return result
 
 
+# Set once per worker process by _init_worker, so the index is sent to
+# each worker once rather than with every document
+_worker_index: LinkIndex | None = None
+
+
+def _init_worker(index: LinkIndex) -> None:
+    global _worker_index
+    _worker_index = index
+
+
+def _check_doc_in_worker(doc: ParsedDoc) -> tuple[ValidationResult, MarkdownScan]:
+    return _check_doc(doc, _worker_index), doc.scan
+
+
+def _check_docs_parallel(docs: list[ParsedDoc], index: LinkIndex,
+                         jobs: int) -> list[ValidationResult]:
+    """
+    Run the per-document checks on a process pool, in input order.
+
+    Each doc's scan comes back with its result and is kept on the doc, so
+    the parse cache records it and later checks here don't re-parse.
+    """
+    chunksize = max(1, len(docs) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(index,)) as pool:
+        outcomes = list(pool.map(_check_doc_in_worker, docs, chunksize=chunksize))
+    for doc, (_, scan) in zip(docs, outcomes):
+        doc.scan = scan
+    return [doc_result for doc_result, _ in outcomes]
+
+
 def validate_all(config: PipelineConfig,
-                 paths: list[Path] | None = None) -> ValidationResult:
+                 paths: list[Path] | None = None,
+                 corpus: DocCorpus | None = None,
+                 jobs: int = 1) -> ValidationResult:
     """
     Validate documents.
 
     If paths is provided, validate only those files (but still load all docs
     for cross-reference checks). If None, validate everything under docs/.
+    The cross-document checks always cover the whole corpus.
+    Pass an already-loaded corpus to avoid parsing docs/ again.
+
+    With jobs > 1, the per-document checks run on a pool of that many
+    processes; the cross-document checks run here, after the pool, so
+    they reuse the scans the workers computed. Results are merged in
+    file order, so the output is the same for any number of jobs.
     """
-    all_docs = parse_all_docs(config.docs_dir)
+    if corpus is None:
+        corpus = DocCorpus.load(config.docs_dir)
+    all_docs = corpus.docs
+    index = LinkIndex.build(config, corpus)
     result = validate_unique_uids(all_docs)
-    result.merge(validate_orphaned_images(all_docs, config))
 
-    if paths:
+    if paths is not None:
         targets = {p.resolve() for p in paths}
         docs_to_check = [d for d in all_docs if d.path.resolve() in targets]
     else:
         docs_to_check = all_docs
 
-    for doc in docs_to_check:
-        doc_result = validate_doc(doc, all_docs, config)
+    if jobs > 1 and len(docs_to_check) > 1:
+        doc_results = _check_docs_parallel(docs_to_check, index, jobs)
+    else:
+        doc_results = [_check_doc(doc, index) for doc in docs_to_check]
+
+    result.merge(validate_orphaned_images(all_docs, config))
+    for doc_result in doc_results:
         result.merge(doc_result)
 
     return result
+
+
+# ---------------------------------------------------------------------------
+# Incremental validation
+# ---------------------------------------------------------------------------
+
+
+def _reference_targets(doc: ParsedDoc) -> set[str]:
+    """Normalized paths of every relative link and image target in a doc."""
+    targets: set[str] = set()
+    for _, ref in doc.scan.links + doc.scan.images:
+        target = ref.split("#", 1)[0]
+        if not target or "://" in target or target.startswith("mailto:"):
+            continue
+        targets.add(LinkIndex.resolve(doc.path, target))
+    return targets
+
+
+def build_reverse_links(corpus: DocCorpus) -> dict[str, set[str]]:
+    """Map each referenced file path to the paths of the docs referencing it."""
+    reverse: dict[str, set[str]] = {}
+    for doc in corpus.docs:
+        source = os.path.normpath(doc.path)
+        for target in _reference_targets(doc):
+            reverse.setdefault(target, set()).add(source)
+    return reverse
+
+
+def changed_paths_since(config: PipelineConfig, ref: str) -> set[str] | None:
+    """
+    Paths changed between `ref` and the working tree, including untracked
+    files. Both sides of a rename are included, so links to the old name
+    count as affected. Returns None if git fails.
+    """
+    try:
+        diff = subprocess.run(
+            ["git", "diff", "--name-status", "-M", "-z", ref, "--"],
+            cwd=config.repo_root, capture_output=True, text=True, check=True,
+        )
+        untracked = subprocess.run(
+            ["git", "ls-files", "--others", "--exclude-standard", "-z"],
+            cwd=config.repo_root, capture_output=True, text=True, check=True,
+        )
+    except subprocess.CalledProcessError as e:
+        logger.warning("git diff against '%s' failed: %s", ref, e.stderr.strip())
+        return None
+
+    names: list[str] = []
+    fields = diff.stdout.split("\0")
+    i = 0
+    while i < len(fields) and fields[i]:
+        status = fields[i]
+        count = 2 if status[0] in "RC" else 1
+        names.extend(fields[i + 1:i + 1 + count])
+        i += 1 + count
+    names.extend(n for n in untracked.stdout.split("\0") if n)
+
+    return {os.path.normpath(os.path.join(config.repo_root, n)) for n in names}
+
+
+def docs_affected_by(corpus: DocCorpus, changed: set[str]) -> list[Path]:
+    """
+    The documents to re-validate after `changed` paths were modified:
+    the changed documents themselves plus every document linking to (or
+    embedding) a changed path, including deleted and renamed ones.
+    """
+    reverse = build_reverse_links(corpus)
+    affected = set(changed)
+    for path in changed:
+        affected.update(reverse.get(path, ()))
+    return [doc.path for doc in corpus.docs
+            if os.path.normpath(doc.path) in affected]
@@ -15,6 +15,12 @@ Usage:
     # Publish all docs (force full re-publish)
     python scripts/publish_to_notion.py --mode draft --all
 
+    # Publish up to 4 documents concurrently
+    python scripts/publish_to_notion.py --mode release --all --jobs 4
+
+    # Same, with the asyncio client: up to 16 documents in flight
+    python scripts/publish_to_notion.py --mode release --all --async --jobs 16
+
 Environment variables required:
     NOTION_TOKEN
     NOTION_DATABASE_ID_DOCUMENTS
@@ -27,6 +33,7 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import logging
 import sys
@@ -35,8 +42,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from docctl.config import load_config
-from docctl.frontmatter import parse_all_docs
+from docctl.corpus import DocCorpus
+from docctl.parse_cache import PARSE_CACHE_FILE, ParseCache
 from docctl.publish import publish_changed_docs
+from docctl.publish_async import publish_changed_docs_async
 
 logging.basicConfig(
     level=logging.INFO,
@@ -66,6 +75,25 @@ def main() -> int:
         dest="publish_all",
         help="Publish all docs (not just changed ones)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of documents to publish concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--async",
+        action="store_true",
+        dest="use_async",
+        help="Publish with the asyncio Notion client; --jobs sets how many "
+             "documents are in flight",
+    )
+    parser.add_argument(
+        "--verify-remote",
+        action="store_true",
+        help="Read current page content from Notion instead of the "
+             "local publish-state cache in docs/.meta",
+    )
     parser.add_argument(
         "--output",
         type=Path,
@@ -91,6 +119,8 @@ def main() -> int:
 
     is_release = args.mode == "release"
     doc_paths = None
+    cache = ParseCache.load(config.meta_dir / PARSE_CACHE_FILE, config.repo_root)
+    corpus = DocCorpus.load(config.docs_dir, cache)
 
     if args.files:
         doc_paths = [
@@ -98,16 +128,24 @@ def main() -> int:
             for f in args.files
         ]
     elif args.publish_all:
-        doc_paths = [d.path for d in parse_all_docs(config.docs_dir)]
+        doc_paths = corpus.paths
 
     mode_label = "RELEASE" if is_release else "DRAFT"
     logger.info("Starting %s publish pipeline", mode_label)
 
-    results = publish_changed_docs(
+    publish_options = dict(
         config=config,
         is_release=is_release,
         doc_paths=doc_paths,
+        jobs=args.jobs,
+        verify_remote=args.verify_remote,
+        corpus=corpus,
     )
+    if args.use_async:
+        results = asyncio.run(publish_changed_docs_async(**publish_options))
+    else:
+        results = publish_changed_docs(**publish_options)
+    cache.save()
 
     # Report results
     errors = [r for r in results if r.get("status") == "error"]
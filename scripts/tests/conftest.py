@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Make the docctl package importable without installing it
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
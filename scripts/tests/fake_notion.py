@@ -0,0 +1,153 @@
+"""
+In-memory stand-in for the parts of notion_client.Client that docctl uses.
+
+Blocks are stored as the API returns them (with ids and has_children),
+and every write is checked against Notion's request limits, so a test
+fails the way a real publish would.
+"""
+
+from __future__ import annotations
+
+import copy
+import itertools
+import json
+
+MAX_BLOCKS_PER_ARRAY = 100
+MAX_BLOCKS_PER_REQUEST = 1000
+MAX_NESTING_DEPTH = 2
+MAX_PAYLOAD_BYTES = 500_000
+
+
+class RequestRejected(Exception):
+    """A request the real API would answer with a 400."""
+
+
+def check_request(children: list[dict], **fields: object) -> None:
+    """Raise RequestRejected if a request body breaks a Notion limit."""
+    body = {**fields, "children": children}
+    if len(json.dumps(body, ensure_ascii=False).encode()) > MAX_PAYLOAD_BYTES:
+        raise RequestRejected("payload too large")
+    total = 0
+
+    def walk(blocks: list[dict], level: int) -> None:
+        nonlocal total
+        if len(blocks) > MAX_BLOCKS_PER_ARRAY:
+            raise RequestRejected(f"{len(blocks)} blocks in one array")
+        for block in blocks:
+            total += 1
+            nested = block[block["type"]].get("children")
+            if nested:
+                if level >= MAX_NESTING_DEPTH:
+                    raise RequestRejected("children nested too deep")
+                walk(nested, level + 1)
+
+    walk(children, 1)
+    if total > MAX_BLOCKS_PER_REQUEST:
+        raise RequestRejected(f"{total} blocks in one request")
+
+
+class _Namespace:
+    pass
+
+
+class FakeNotion:
+    """Pages and blocks in dicts; `log` records each write in order."""
+
+    def __init__(self) -> None:
+        self._ids = itertools.count(1)
+        self.blocks_by_id: dict[str, dict] = {}
+        self.children: dict[str, list[str]] = {}
+        self.log: list[tuple[str, str]] = []
+
+        self.pages = _Namespace()
+        self.pages.create = self._create_page
+        self.blocks = _Namespace()
+        self.blocks.update = self._update
+        self.blocks.delete = self._delete
+        self.blocks.children = _Namespace()
+        self.blocks.children.list = self._list
+        self.blocks.children.append = self._append
+
+    def _new_id(self) -> str:
+        return f"block-{next(self._ids):05d}"
+
+    def _add(self, parent_id: str, blocks: list[dict],
+             after: str | None = None) -> list[dict]:
+        siblings = self.children.setdefault(parent_id, [])
+        position = len(siblings) if after is None else siblings.index(after) + 1
+        created = []
+        for block in blocks:
+            block = copy.deepcopy(block)
+            nested = block[block["type"]].pop("children", None)
+            block["id"] = self._new_id()
+            block["has_children"] = bool(nested)
+            self.blocks_by_id[block["id"]] = block
+            siblings.insert(position, block["id"])
+            position += 1
+            if nested:
+                self._add(block["id"], nested)
+            created.append(copy.deepcopy(block))
+        return created
+
+    # --- API surface ---
+
+    def _create_page(self, parent: dict, properties: dict,
+                     children: list[dict] = ()) -> dict:
+        check_request(list(children), parent=parent, properties=properties)
+        page_id = self._new_id()
+        self.log.append(("create", page_id))
+        self._add(page_id, list(children))
+        return {"id": page_id, "properties": properties}
+
+    def _append(self, block_id: str, children: list[dict],
+                after: str | None = None) -> dict:
+        check_request(children, after=after)
+        self.log.append(("append", block_id))
+        return {"results": self._add(block_id, children, after)}
+
+    def _list(self, block_id: str, page_size: int = 100,
+              start_cursor: str | None = None) -> dict:
+        ids = self.children.get(block_id, [])
+        start = int(start_cursor or 0)
+        more = start + page_size < len(ids)
+        return {
+            "results": [copy.deepcopy(self.blocks_by_id[i])
+                        for i in ids[start:start + page_size]],
+            "has_more": more,
+            "next_cursor": str(start + page_size) if more else None,
+        }
+
+    def _update(self, block_id: str, **payload: dict) -> dict:
+        self.log.append(("update", block_id))
+        block = self.blocks_by_id[block_id]
+        for btype, data in payload.items():
+            block[btype].update(copy.deepcopy(data))
+        return copy.deepcopy(block)
+
+    def _delete(self, block_id: str) -> dict:
+        self.log.append(("delete", block_id))
+        for siblings in self.children.values():
+            if block_id in siblings:
+                siblings.remove(block_id)
+        return {}
+
+    # --- Test helpers ---
+
+    def add_child_page(self, parent_id: str, title: str) -> str:
+        """Put a child page (an archive, say) on a page; its block id."""
+        block = {"type": "child_page", "child_page": {"title": title}}
+        return self._add(parent_id, [block])[0]["id"]
+
+    def tree(self, parent_id: str) -> list[dict]:
+        """A page's content as payloads, children nested like on create."""
+        out = []
+        for block_id in self.children.get(parent_id, []):
+            block = copy.deepcopy(self.blocks_by_id[block_id])
+            btype = block["type"]
+            for key in ("id", "has_children"):
+                block.pop(key)
+            nested = self.tree(block_id)
+            if nested:
+                block[btype]["children"] = nested
+            out.append(block)
+        return out
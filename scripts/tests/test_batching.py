@@ -0,0 +1,129 @@
+"""Tests for docctl.batching against Notion's request limits."""
+
+import copy
+
+from docctl.batching import (
+    NOTION_MAX_PAYLOAD_BYTES,
+    PAYLOAD_ENVELOPE_BYTES,
+    json_size,
+    plan_block_batches,
+)
+from docctl.md_to_notion import (
+    _bulleted_list_item,
+    _paragraph_block,
+    _table_block,
+    _text,
+)
+from docctl.notion_api import append_blocks, create_page
+from fake_notion import FakeNotion, check_request
+
+PAGE = "page-1"
+
+
+def _nested_list(depth: int, width: int = 2, label: str = "item") -> list[dict]:
+    """`width` items per level, `depth` levels deep."""
+    if depth == 0:
+        return []
+    return [
+        _bulleted_list_item([_text(f"{label}.{i}")],
+                            _nested_list(depth - 1, width, f"{label}.{i}"))
+        for i in range(width)
+    ]
+
+
+def _table(rows: int, cell: str = "x", width: int = 3) -> dict:
+    return _table_block([[[_text(f"{cell}{r}.{c}")] for c in range(width)]
+                         for r in range(rows)])
+
+
+def _upload(blocks: list[dict]) -> FakeNotion:
+    """Append `blocks` to an empty page; every request is limit-checked."""
+    client = FakeNotion()
+    before = copy.deepcopy(blocks)
+    append_blocks(client, PAGE, blocks)
+    assert blocks == before, "input blocks were modified"
+    assert client.tree(PAGE) == blocks
+    return client
+
+
+def test_five_level_list():
+    blocks = _nested_list(5)
+    client = _upload(blocks)
+    # A block goes in a request only with its whole subtree, so each level
+    # is appended on its own until the last two, which travel together
+    assert len(client.log) == 1 + 2 + 4 + 8
+
+
+def test_250_row_table():
+    table = _table(250)
+    batches = list(plan_block_batches([table]))
+    assert len(batches) == 1
+    [(index, rest)] = batches[0].follow_ups
+    assert index == 0
+    assert len(batches[0].blocks[0]["table"]["children"]) == 100
+    assert len(rest) == 150
+    _upload([table])
+
+
+def test_paragraphs_near_payload_limit():
+    blocks = [_paragraph_block([_text(f"{i:04d}" + "a" * 1995)])
+              for i in range(400)]
+    batches = list(plan_block_batches(blocks))
+    assert len(batches) > 1
+    budget = NOTION_MAX_PAYLOAD_BYTES - PAYLOAD_ENVELOPE_BYTES
+    for batch in batches:
+        assert batch.size >= json_size(batch.blocks)
+        assert batch.size <= budget
+        check_request(batch.blocks)
+    _upload(blocks)
+
+
+def test_table_near_payload_limit():
+    # ~6 KB per row: the byte budget, not the row limit, splits the table
+    table = _table(95, cell="c" * 1500, width=4)
+    batches = list(plan_block_batches([_paragraph_block([_text("intro")]), table]))
+    assert len(batches) == 1
+    [(index, rest)] = batches[0].follow_ups
+    assert index == 1
+    assert 0 < len(rest) < 95
+    _upload([_paragraph_block([_text("intro")]), table])
+
+
+def test_page_properties_reserve_payload_room():
+    properties = {"Notes": {"rich_text": [_text("p" * 1990)] * 40}}
+    blocks = [_paragraph_block([_text(f"{i:04d}" + "a" * 1995)])
+              for i in range(230)]
+    client = FakeNotion()
+    page = create_page(client, "db", properties, blocks)
+    assert client.tree(page["id"]) == blocks
+    first = next(plan_block_batches(blocks, reserved_bytes=json_size(properties)))
+    assert first.size + json_size(properties) <= NOTION_MAX_PAYLOAD_BYTES
+
+
+def test_follow_up_indexes_after_trimmed_block():
+    blocks = [
+        _paragraph_block([_text("first")]),
+        _bulleted_list_item([_text("long")], _nested_list(1, width=150)),
+        _paragraph_block([_text("middle")]),
+        _bulleted_list_item([_text("deep")], _nested_list(3)),
+        _paragraph_block([_text("last")]),
+    ]
+    [batch] = plan_block_batches(blocks)
+    assert [index for index, _ in batch.follow_ups] == [1, 3]
+    assert len(batch.follow_ups[0][1]) == 50
+    assert len(batch.blocks[1]["bulleted_list_item"]["children"]) == 100
+    _upload(blocks)
+
+
+def test_follow_ups_in_later_batches():
+    blocks = ([_paragraph_block([_text(str(i))]) for i in range(120)]
+              + [_table(130)]
+              + [_paragraph_block([_text("end")])])
+    batches = list(plan_block_batches(blocks))
+    assert [len(b.blocks) for b in batches] == [100, 22]
+    assert batches[0].follow_ups == []
+    assert [index for index, _ in batches[1].follow_ups] == [20]
+    client = FakeNotion()
+    create_page(client, "db", {}, blocks)
+    page_id = client.log[0][1]
+    assert client.tree(page_id) == blocks
@@ -0,0 +1,49 @@
+"""Tests for page mentions in docctl.md_to_notion."""
+
+from pathlib import Path
+
+from docctl.frontmatter import ParsedDoc
+from docctl.md_to_notion import PageMentionIndex, markdown_to_blocks
+
+PAGE_ID = "13b4efc7-c610-80e9-b35e-d246cb753dde"
+DATABASE_ID = "2a1c9e0b7d4f4c3e8b6a5d4c3b2a1f0e"
+
+MENTIONS = PageMentionIndex.build(
+    doc_uids={"docs/SOP/document-control.md": "MOS-ENG-SOP-001"},
+    page_id_lookup={"MOS-ENG-SOP-001": PAGE_ID},
+)
+
+
+def _rich_text(markdown: str) -> list[dict]:
+    doc = ParsedDoc(path=Path("docs/POL/policy.md"), metadata={},
+                    content=markdown)
+    blocks = markdown_to_blocks(doc, MENTIONS)
+    return blocks[0]["paragraph"]["rich_text"]
+
+
+def test_published_page_url_becomes_mention():
+    url = ("https://www.notion.so/mosaicdesignlabs/Document-Control-"
+           f"{PAGE_ID.replace('-', '')}?pvs=4")
+    rich_text = _rich_text(f"See [the SOP]({url}).")
+    assert rich_text[1] == {
+        "type": "mention",
+        "mention": {"type": "page", "page": {"id": PAGE_ID}},
+    }
+
+
+def test_relative_link_to_published_doc_becomes_mention():
+    rich_text = _rich_text("See [the SOP](../SOP/document-control.md).")
+    assert rich_text[1]["mention"]["page"]["id"] == PAGE_ID
+
+
+def test_database_view_url_stays_link():
+    url = f"https://www.notion.so/mosaicdesignlabs/{DATABASE_ID}?v=0123456789abcdef0123456789abcdef"
+    rich_text = _rich_text(f"Track it in [the inventory]({url}).")
+    assert [rt["type"] for rt in rich_text] == ["text", "text", "text"]
+    assert rich_text[1]["text"]["link"] == {"url": url}
+
+
+def test_unpublished_page_url_stays_link():
+    url = "https://mosaicdesignlabs.notion.site/Team-Wiki-0f1e2d3c4b5a69788796a5b4c3d2e1f0"
+    rich_text = _rich_text(f"See [the wiki]({url}).")
+    assert rich_text[1]["text"]["link"] == {"url": url}
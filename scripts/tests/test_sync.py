@@ -0,0 +1,130 @@
+"""Tests for block-level page reconciliation in docctl.sync."""
+
+import copy
+
+from docctl.md_to_notion import (
+    _bulleted_list_item,
+    _heading_block,
+    _paragraph_block,
+    _table_block,
+    _text,
+)
+from docctl.notion_api import append_blocks
+from docctl.sync import sync_page_content
+from fake_notion import FakeNotion
+
+PAGE = "page-1"
+
+
+def _p(text: str) -> dict:
+    return _paragraph_block([_text(text)])
+
+
+def _h(text: str) -> dict:
+    return _heading_block(2, [_text(text)])
+
+
+def _li(text: str, children: list[dict] | None = None) -> dict:
+    return _bulleted_list_item([_text(text)], children)
+
+
+def _page(blocks: list[dict]) -> FakeNotion:
+    client = FakeNotion()
+    append_blocks(client, PAGE, copy.deepcopy(blocks))
+    client.log.clear()
+    return client
+
+
+def _content(client: FakeNotion) -> list[dict]:
+    return [b for b in client.tree(PAGE) if b["type"] != "child_page"]
+
+
+def _sync(client: FakeNotion, new_blocks: list[dict]) -> dict:
+    expected = copy.deepcopy(new_blocks)
+    stats = sync_page_content(client, PAGE, new_blocks)
+    assert _content(client) == expected
+    assert stats["delete_failed"] == []
+    return stats
+
+
+def _ids(client: FakeNotion, parent_id: str = PAGE) -> list[str]:
+    return list(client.children.get(parent_id, []))
+
+
+def test_unchanged_page_makes_no_writes():
+    blocks = [_h("Scope"), _p("one"), _li("a", [_li("b")])]
+    client = _page(blocks)
+    stats = _sync(client, blocks)
+    assert client.log == []
+    assert stats["kept"] == 4
+
+
+def test_insert_before_first_retained_block_replaces_content():
+    client = _page([_p("one"), _p("two")])
+    old_ids = _ids(client)
+    stats = _sync(client, [_h("new"), _p("one"), _p("two")])
+    assert stats["kept"] == 0
+    assert stats["inserted"] == 3
+    assert stats["deleted"] == 2
+    assert not set(old_ids) & set(_ids(client))
+
+
+def test_unanchored_child_insert_rebuilds_parent():
+    client = _page([_p("intro"), _li("list", [_li("a"), _li("b")])])
+    intro_id, list_id = _ids(client)
+    new_blocks = [_p("intro"), _li("list", [_h("new"), _li("a"), _li("b")])]
+    stats = _sync(client, new_blocks)
+    assert _ids(client)[0] == intro_id
+    assert list_id not in _ids(client)
+    assert new_blocks[1]["id"] == _ids(client)[1]
+    assert (stats["kept"], stats["inserted"], stats["deleted"]) == (1, 1, 1)
+
+
+def test_table_cell_edit_updates_one_row():
+    rows = [[[_text("Rev")], [_text("Date")]],
+            [[_text("A")], [_text("2024-01-01")]],
+            [[_text("B")], [_text("2024-02-01")]]]
+    client = _page([_p("History"), _table_block(rows)])
+    table_id = _ids(client)[1]
+    row_id = _ids(client, table_id)[2]
+
+    rows[2][1] = [_text("2024-03-01")]
+    stats = _sync(client, [_p("History"), _table_block(rows)])
+    assert client.log == [("update", row_id)]
+    assert stats["updated"] == 1
+
+
+def test_child_pages_are_preserved():
+    client = _page([_p("one"), _p("two")])
+    archive_id = client.add_child_page(PAGE, "Archive")
+    client.log.clear()
+
+    _sync(client, [_p("one"), _h("changed"), _p("three")])
+    assert _ids(client)[-1] == archive_id
+    assert ("delete", archive_id) not in client.log
+
+    # Falling back to a full replace keeps them as well
+    _sync(client, [_h("first"), _p("one")])
+    assert archive_id in _ids(client)
+    assert ("delete", archive_id) not in client.log
+
+
+def test_deletes_run_after_all_inserts():
+    client = _page([
+        _p("keep"),
+        _p("gone"),
+        _li("list", [_li("a"), _p("old child")]),
+        _p("also gone"),
+    ])
+    stats = _sync(client, [
+        _p("keep"),
+        _h("inserted"),
+        _li("list", [_li("a"), _h("new child")]),
+        _h("appended"),
+    ])
+    assert (stats["inserted"], stats["deleted"]) == (3, 3)
+    ops = [op for op, _ in client.log]
+    last_append = max(i for i, op in enumerate(ops) if op == "append")
+    first_delete = ops.index("delete")
+    assert last_append < first_delete
+    assert set(ops[first_delete:]) == {"delete"}
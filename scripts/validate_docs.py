@@ -3,9 +3,12 @@
 CLI entry point: validate documents.
 
 Usage:
-    python scripts/validate_docs.py [--repo-root .] [file1.md file2.md ...]
+    python scripts/validate_docs.py [--repo-root .] [--jobs N] [file1.md file2.md ...]
+    python scripts/validate_docs.py [--repo-root .] --changed-since origin/main
 
-If no files are specified, validates all docs under docs/.
+If no files are specified, validates all docs under docs/. With
+--changed-since, validates the docs changed since that Git ref plus every
+doc that links to a changed, deleted or renamed file.
 
 Exit codes:
     0 — all checks passed
@@ -16,6 +19,7 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -23,7 +27,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from docctl.config import load_config
-from docctl.validate import validate_all
+from docctl.corpus import DocCorpus
+from docctl.parse_cache import PARSE_CACHE_FILE, ParseCache
+from docctl.validate import changed_paths_since, docs_affected_by, validate_all
 
 logging.basicConfig(
     level=logging.INFO,
@@ -40,6 +46,20 @@ def main() -> int:
         default=None,
         help="Path to the repo root (default: auto-detect)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes for the per-document checks "
+             "(default: 1; 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="REF",
+        default=None,
+        help="Validate only docs changed since this Git ref, plus the docs "
+             "that link to them (all docs if anything outside docs/ changed)",
+    )
     parser.add_argument(
         "files",
         nargs="*",
@@ -48,6 +68,9 @@ def main() -> int:
     )
     args = parser.parse_args()
 
+    if args.changed_since and args.files:
+        parser.error("--changed-since cannot be combined with explicit files")
+
     config = load_config(args.repo_root)
 
     paths = None
@@ -58,7 +81,32 @@ def main() -> int:
         ]
 
     print(f"Validating docs in {config.docs_dir} ...")
-    result = validate_all(config, paths)
+    cache = ParseCache.load(config.meta_dir / PARSE_CACHE_FILE, config.repo_root)
+    corpus = DocCorpus.load(config.docs_dir, cache)
+
+    if args.changed_since:
+        changed = changed_paths_since(config, args.changed_since)
+        outside = sorted(
+            p for p in changed or ()
+            if not Path(p).is_relative_to(config.docs_dir)
+        )
+        if changed is None:
+            print("  Could not diff against "
+                  f"{args.changed_since}; validating all docs")
+        elif outside:
+            # The validator, its config or other inputs changed: any doc
+            # may be affected
+            print(f"  {len(outside)} changed file(s) outside "
+                  f"{config.docs_dir.name}/ (e.g. "
+                  f"{Path(outside[0]).relative_to(config.repo_root)}); "
+                  "validating all docs")
+        else:
+            paths = docs_affected_by(corpus, changed)
+            print(f"  {len(paths)} doc(s) affected by changes since "
+                  f"{args.changed_since}")
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    result = validate_all(config, paths, corpus, jobs=jobs)
+    cache.save()
 
     if result.warnings:
         print(f"\n⚠  {len(result.warnings)} warning(s):")